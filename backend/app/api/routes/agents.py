@@ -34,8 +34,7 @@ async def get_agent(agent_id: int, db: AsyncSession = Depends(get_db)):
 async def create_agent(agent_data: AgentCreate, db: AsyncSession = Depends(get_db)):
     """Create a new agent"""
     service = AgentService(db)
-    existing = await service.get_agent_by_name(agent_data.name)
-    if existing:
+    if await service.agent_name_exists(agent_data.name):
         raise HTTPException(status_code=400, detail="Agent with this name already exists")
     agent = await service.create_agent(agent_data)
     return agent
@@ -90,7 +89,7 @@ async def pause_agent(agent_id: int, db: AsyncSession = Depends(get_db)):
 async def get_agent_runs(agent_id: int, limit: int = 50, db: AsyncSession = Depends(get_db)):
     """Get agent run history"""
     service = AgentService(db)
-    runs = await service.get_agent_runs(agent_id, limit=limit)
+    runs = await service.list_agent_runs_lite(agent_id, limit=limit)
     return runs
 
 
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
 from app.core.database import get_db
 from app.schemas.agent import TradeCreate, TradeResponse
@@ -13,7 +14,7 @@ router = APIRouter()
 async def get_trades(limit: int = 100, db: AsyncSession = Depends(get_db)):
     """Get all trades"""
     service = AgentService(db)
-    trades = await service.get_all_trades(limit=limit)
+    trades = await service.list_trades_lite(limit=limit)
     return trades
 
 
@@ -21,7 +22,7 @@ async def get_trades(limit: int = 100, db: AsyncSession = Depends(get_db)):
 async def get_open_trades(db: AsyncSession = Depends(get_db)):
     """Get all open trades"""
     service = AgentService(db)
-    trades = await service.get_open_trades()
+    trades = await service.list_open_trades_lite()
     return trades
 
 
@@ -44,8 +45,12 @@ async def close_trade(trade_id: int, pnl: float, db: AsyncSession = Depends(get_
 
 
 @router.get("/stats")
-async def get_trade_stats(db: AsyncSession = Depends(get_db)):
-    """Get trade statistics"""
+async def get_trade_stats(
+    exact: bool = False,
+    since: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get trade statistics (total_trades is a planner estimate unless exact=true or since is set)"""
     service = AgentService(db)
-    stats = await service.get_trade_stats()
+    stats = await service.get_trade_stats(exact=exact, since=since)
     return stats
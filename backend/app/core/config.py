@@ -9,6 +9,10 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "postgresql+asyncpg://postgres:postgres@db:5432/qqqq_agents"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared-statement cache per connection
 
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
@@ -26,6 +30,7 @@ class Settings(BaseSettings):
     # Robinhood Crypto API
     ROBINHOOD_API_KEY: Optional[str] = None
     ROBINHOOD_PRIVATE_KEY: Optional[str] = None  # Base64-encoded ED25519 private key
+    ROBINHOOD_UNSIGNED_MARKET_DATA: bool = False  # Skip signing market-data calls; enable only once confirmed accepted
 
     # Trading Settings
     DRY_RUN: bool = True  # When True, agents recommend but don't execute trades
@@ -36,6 +41,7 @@ class Settings(BaseSettings):
     TARGET_CREDIT_MIN: float = 0.55
     TARGET_CREDIT_MAX: float = 0.70
     MAX_DELTA: float = 0.12
+    TRADE_ARCHIVE_DAYS: int = 90  # Closed trades older than this move to trades_archive
 
     # Orchestrator Settings
     EXECUTION_HOUR: int = 15  # 3 PM ET
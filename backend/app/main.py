@@ -4,10 +4,13 @@ from contextlib import asynccontextmanager
 import structlog
 
 from app.core.config import settings
-from app.core.database import init_db, AsyncSessionLocal, SyncSessionLocal
+from app.core.database import init_db, warm_pool, AsyncSessionLocal, SyncSessionLocal
 from app.api.routes import api_router
 from app.api.websocket import websocket_endpoint
 from app.services.agent_service import AgentService
+from app.services.broker.robinhood_client import get_robinhood_client
+from app.services.crypto_hunter.executor import CryptoExecutor
+from app.services.crypto_hunter.service import CryptoHunterService
 from app.schemas.agent import AgentCreate
 from app.services.scheduler import (
     start_scheduler, stop_scheduler, get_scheduler,
@@ -178,8 +181,17 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting QQQQ Agents application")
     await init_db()
+    await warm_pool()
     await seed_agents()
 
+    # Open the shared Robinhood connection pool for the lifetime of the process
+    app.state.robinhood = None
+    try:
+        app.state.robinhood = get_robinhood_client()
+        await app.state.robinhood.startup()
+    except Exception as e:
+        logger.error("Failed to start Robinhood client", error=str(e))
+
     # Start the background scheduler
     start_scheduler()
     logger.info("Background scheduler initialized")
@@ -194,6 +206,12 @@ async def lifespan(app: FastAPI):
     stop_scheduler()
     logger.info("Background scheduler stopped")
 
+    # Let background order cancels finish while the connection pool is still open
+    await CryptoExecutor.drain_background_tasks()
+    await CryptoHunterService.close_http()
+    if app.state.robinhood:
+        await app.state.robinhood.shutdown()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -1,4 +1,4 @@
-from .agent import Agent, AgentRun, Trade, Regime, AgentStatus, RegimeType, TradeRecommendation, RecommendationStatus
+from .agent import Agent, AgentRun, Trade, TradeArchive, Regime, AgentStatus, RegimeType, TradeRecommendation, RecommendationStatus
 from .metrics import AgentMetric, SystemMetric
 from .crypto import CryptoPosition, CryptoWatchlist, CryptoTrade, CryptoQuoteCache, CryptoPositionStatus, CryptoWatchlistStatus, CryptoOrderStatus
 
@@ -6,6 +6,7 @@ __all__ = [
     "Agent",
     "AgentRun",
     "Trade",
+    "TradeArchive",
     "Regime",
     "AgentStatus",
     "RegimeType",
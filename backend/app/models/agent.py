@@ -69,7 +69,7 @@ class Trade(Base):
     max_risk = Column(Float)
     pnl = Column(Float)
     status = Column(String(20), default="open")  # open, closed, expired
-    opened_at = Column(DateTime(timezone=True), server_default=func.now())
+    opened_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     closed_at = Column(DateTime(timezone=True))
     expiration = Column(DateTime(timezone=True))
     notes = Column(Text)
@@ -77,6 +77,29 @@ class Trade(Base):
     agent = relationship("Agent", back_populates="trades")
 
 
+class TradeArchive(Base):
+    """Cold storage for closed trades moved out of the hot trades table"""
+    __tablename__ = "trades_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # Keeps the original trades.id
+    agent_id = Column(Integer, ForeignKey("agents.id"), nullable=False)
+    trade_type = Column(String(50))
+    symbol = Column(String(10))
+    short_strike = Column(Float)
+    long_strike = Column(Float)
+    contracts = Column(Integer)
+    premium_received = Column(Float)
+    premium_paid = Column(Float)
+    max_risk = Column(Float)
+    pnl = Column(Float)
+    status = Column(String(20))
+    opened_at = Column(DateTime(timezone=True), index=True)
+    closed_at = Column(DateTime(timezone=True))
+    expiration = Column(DateTime(timezone=True))
+    notes = Column(Text)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class Regime(Base):
     __tablename__ = "regimes"
 
@@ -1,20 +1,90 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
-from sqlalchemy.orm import selectinload
-from typing import List, Optional
-from datetime import datetime
+import asyncio
 
-from app.models.agent import Agent, AgentRun, Trade, Regime, AgentStatus, RegimeType
-from app.schemas.agent import AgentCreate, AgentUpdate, TradeCreate
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select, update, insert, delete, func, text, case, exists, union_all
+from sqlalchemy import event
+from sqlalchemy.orm import selectinload, Session
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.agent import Agent, AgentRun, Trade, TradeArchive, Regime, AgentStatus, RegimeType
+from app.schemas.agent import AgentCreate, AgentUpdate, AgentResponse, AgentRunResponse, TradeCreate, TradeResponse
+
+# Column sets for the read-only list queries: exactly what the response
+# schemas serialize, fetched as plain row mappings instead of ORM instances.
+_TRADE_LIST_COLUMNS = tuple(getattr(Trade, name) for name in TradeResponse.model_fields)
+_AGENT_RUN_LIST_COLUMNS = tuple(getattr(AgentRun, name) for name in AgentRunResponse.model_fields)
+
+# In-process cache for get_all_agents. Agent definitions change rarely, so the
+# list is kept until any session commits a write to the agents table, which
+# bumps _agents_version (see the session event hooks below).
+_agents_version = 0
+_agents_cache: Optional[Tuple[int, Tuple[AgentResponse, ...]]] = None
+
+
+def invalidate_agents_cache():
+    global _agents_version
+    _agents_version += 1
+
+
+@event.listens_for(Agent, "after_insert")
+@event.listens_for(Agent, "after_update")
+@event.listens_for(Agent, "after_delete")
+def _flag_agent_flush(mapper, connection, target):
+    Session.object_session(target).info["agents_dirty"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_agent_bulk_write(orm_execute_state):
+    if orm_execute_state.is_select:
+        return
+    if orm_execute_state.bind_mapper is Agent.__mapper__:
+        orm_execute_state.session.info["agents_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop("agents_dirty", False):
+        invalidate_agents_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session):
+    session.info.pop("agents_dirty", None)
 
 
 class AgentService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, session_factory: async_sessionmaker = AsyncSessionLocal):
         self.db = db
+        # Independent read-only queries run concurrently on their own short-lived
+        # sessions, since a single AsyncSession must not be shared across tasks.
+        self.session_factory = session_factory
+
+    async def _scalar(self, stmt, params: dict = None):
+        async with self.session_factory() as session:
+            result = await session.execute(stmt, params)
+            return result.scalar()
+
+    async def _one(self, stmt, params: dict = None):
+        async with self.session_factory() as session:
+            result = await session.execute(stmt, params)
+            return result.one()
+
+    async def get_all_agents(self) -> List[AgentResponse]:
+        global _agents_cache
+        version = _agents_version
+        if _agents_cache is not None and _agents_cache[0] == version:
+            # Deep copies: callers get their own models (config is a mutable dict)
+            return [a.model_copy(deep=True) for a in _agents_cache[1]]
 
-    async def get_all_agents(self) -> List[Agent]:
         result = await self.db.execute(select(Agent).order_by(Agent.id))
-        return result.scalars().all()
+        agents = tuple(AgentResponse.model_validate(a) for a in result.scalars().all())
+        # Tagged with the version read before the query, so a concurrent write
+        # leaves this entry already stale rather than caching pre-write rows.
+        _agents_cache = (version, agents)
+        return [a.model_copy(deep=True) for a in agents]
 
     async def get_agent(self, agent_id: int) -> Optional[Agent]:
         result = await self.db.execute(select(Agent).where(Agent.id == agent_id))
@@ -24,6 +94,10 @@ class AgentService:
         result = await self.db.execute(select(Agent).where(Agent.name == name))
         return result.scalar_one_or_none()
 
+    async def agent_name_exists(self, name: str) -> bool:
+        result = await self.db.execute(select(exists().where(Agent.name == name)))
+        return result.scalar()
+
     async def get_agent_by_type(self, agent_type: str) -> Optional[Agent]:
         result = await self.db.execute(select(Agent).where(Agent.agent_type == agent_type))
         return result.scalar_one_or_none()
@@ -35,37 +109,42 @@ class AgentService:
         await self.db.refresh(agent)
         return agent
 
-    async def update_agent(self, agent_id: int, agent_data: AgentUpdate) -> Optional[Agent]:
-        agent = await self.get_agent(agent_id)
-        if not agent:
+    async def _update_returning(self, model, row_id: int, **values):
+        """UPDATE ... RETURNING the full row, so a missing id is detected without a prior SELECT"""
+        result = await self.db.execute(
+            update(model)
+            .where(model.id == row_id)
+            .values(**values)
+            .returning(model)
+            .execution_options(populate_existing=True)
+        )
+        obj = result.scalar_one_or_none()
+        if obj is None:
             return None
 
+        await self.db.commit()
+        return obj
+
+    async def update_agent(self, agent_id: int, agent_data: AgentUpdate) -> Optional[Agent]:
         update_data = agent_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(agent, key, value)
+        if not update_data:
+            return await self.get_agent(agent_id)
 
-        await self.db.commit()
-        await self.db.refresh(agent)
-        return agent
+        return await self._update_returning(Agent, agent_id, **update_data)
 
     async def update_agent_status(self, agent_id: int, status: AgentStatus) -> Optional[Agent]:
-        agent = await self.get_agent(agent_id)
-        if not agent:
-            return None
-
-        agent.status = status
-        await self.db.commit()
-        await self.db.refresh(agent)
-        return agent
+        return await self._update_returning(Agent, agent_id, status=status)
 
     async def start_agent_run(self, agent_id: int) -> AgentRun:
         run = AgentRun(agent_id=agent_id, status=AgentStatus.RUNNING)
         self.db.add(run)
+        # started_at comes back from the INSERT's server default
+        await self.db.flush()
 
-        # Update the agent's last_run_at timestamp
-        agent = await self.get_agent(agent_id)
-        if agent:
-            agent.last_run_at = datetime.utcnow()
+        # Update the agent's last_run_at timestamp from the same DB clock
+        await self.db.execute(
+            update(Agent).where(Agent.id == agent_id).values(last_run_at=run.started_at)
+        )
 
         await self.db.commit()
         await self.db.refresh(run)
@@ -78,19 +157,14 @@ class AgentService:
         result: dict = None,
         error_message: str = None
     ) -> Optional[AgentRun]:
-        result_query = await self.db.execute(select(AgentRun).where(AgentRun.id == run_id))
-        run = result_query.scalar_one_or_none()
-        if not run:
-            return None
-
-        run.ended_at = datetime.utcnow()
-        run.status = status
-        run.result = result
-        run.error_message = error_message
-
-        await self.db.commit()
-        await self.db.refresh(run)
-        return run
+        return await self._update_returning(
+            AgentRun,
+            run_id,
+            ended_at=func.now(),
+            status=status,
+            result=result,
+            error_message=error_message
+        )
 
     async def get_agent_runs(self, agent_id: int, limit: int = 50) -> List[AgentRun]:
         result = await self.db.execute(
@@ -101,6 +175,15 @@ class AgentService:
         )
         return result.scalars().all()
 
+    async def list_agent_runs_lite(self, agent_id: int, limit: int = 50) -> List[dict]:
+        result = await self.db.execute(
+            select(*_AGENT_RUN_LIST_COLUMNS)
+            .where(AgentRun.agent_id == agent_id)
+            .order_by(AgentRun.started_at.desc())
+            .limit(limit)
+        )
+        return result.mappings().all()
+
     async def create_trade(self, trade_data: TradeCreate) -> Trade:
         trade = Trade(**trade_data.model_dump())
         self.db.add(trade)
@@ -120,19 +203,48 @@ class AgentService:
         )
         return result.scalars().all()
 
-    async def close_trade(self, trade_id: int, pnl: float) -> Optional[Trade]:
-        result = await self.db.execute(select(Trade).where(Trade.id == trade_id))
-        trade = result.scalar_one_or_none()
-        if not trade:
-            return None
+    async def list_open_trades_lite(self) -> List[dict]:
+        result = await self.db.execute(
+            select(*_TRADE_LIST_COLUMNS).where(Trade.status == "open").order_by(Trade.opened_at.desc())
+        )
+        return result.mappings().all()
 
-        trade.status = "closed"
-        trade.closed_at = datetime.utcnow()
-        trade.pnl = pnl
+    async def list_trades_lite(self, limit: int = 100) -> List[dict]:
+        result = await self.db.execute(
+            select(*_TRADE_LIST_COLUMNS).order_by(Trade.opened_at.desc()).limit(limit)
+        )
+        return result.mappings().all()
 
+    async def close_trade(self, trade_id: int, pnl: float) -> Optional[Trade]:
+        return await self._update_returning(
+            Trade,
+            trade_id,
+            status="closed",
+            closed_at=func.now(),
+            pnl=pnl
+        )
+
+    async def archive_closed_trades(self, older_than_days: int = None) -> int:
+        """Move closed trades older than the cutoff into trades_archive in one statement"""
+        if older_than_days is None:
+            older_than_days = settings.TRADE_ARCHIVE_DAYS
+
+        trades = Trade.__table__
+        columns = [c.name for c in trades.c]
+        moved = (
+            delete(trades)
+            .where(
+                trades.c.status == "closed",
+                trades.c.closed_at < func.now() - timedelta(days=older_than_days)
+            )
+            .returning(*trades.c)
+            .cte("moved")
+        )
+        result = await self.db.execute(
+            insert(TradeArchive.__table__).from_select(columns, select(*[moved.c[name] for name in columns]))
+        )
         await self.db.commit()
-        await self.db.refresh(trade)
-        return trade
+        return result.rowcount
 
     async def get_current_regime(self) -> Optional[Regime]:
         result = await self.db.execute(
@@ -141,54 +253,90 @@ class AgentService:
         return result.scalar_one_or_none()
 
     async def set_regime(self, regime_type: RegimeType, qqq_price: float, recovery_strike: float = None) -> Regime:
-        # End current regime
-        current = await self.get_current_regime()
-        if current:
-            current.is_active = False
-            current.ended_at = datetime.utcnow()
-
-        # Start new regime
-        new_regime = Regime(
-            regime_type=regime_type,
-            qqq_price_at_start=qqq_price,
-            recovery_strike=recovery_strike,
-            is_active=True
-        )
-        self.db.add(new_regime)
-        await self.db.commit()
-        await self.db.refresh(new_regime)
-        return new_regime
-
-    async def get_trade_stats(self) -> dict:
-        total_result = await self.db.execute(select(func.count(Trade.id)))
-        total = total_result.scalar()
-
-        open_result = await self.db.execute(
-            select(func.count(Trade.id)).where(Trade.status == "open")
+        # End the current regime and start the new one in a single statement:
+        # WITH ended AS (UPDATE regimes ... RETURNING id) INSERT INTO regimes ... RETURNING *
+        regimes = Regime.__table__
+        ended = (
+            update(regimes)
+            .where(regimes.c.is_active == True)
+            .values(is_active=False, ended_at=func.now())
+            .returning(regimes.c.id)
+            .cte("ended")
         )
-        open_count = open_result.scalar()
-
-        closed_result = await self.db.execute(
-            select(func.count(Trade.id)).where(Trade.status == "closed")
-        )
-        closed_count = closed_result.scalar()
-
-        pnl_result = await self.db.execute(
-            select(func.sum(Trade.pnl)).where(Trade.status == "closed")
+        result = await self.db.execute(
+            insert(Regime)
+            .values(
+                regime_type=regime_type,
+                qqq_price_at_start=qqq_price,
+                recovery_strike=recovery_strike,
+                is_active=True
+            )
+            .returning(Regime)
+            .add_cte(ended)
         )
-        total_pnl = pnl_result.scalar() or 0
+        new_regime = result.scalar_one()
+        await self.db.commit()
+        return new_regime
 
-        winning_result = await self.db.execute(
-            select(func.count(Trade.id)).where(Trade.status == "closed", Trade.pnl > 0)
+    async def _estimate_trade_count(self) -> Optional[int]:
+        """Planner row estimate for trades plus trades_archive (O(1), refreshed by ANALYZE)"""
+        tables, lowest, estimate = await self._one(
+            text(
+                "SELECT count(*), min(reltuples), sum(reltuples)::bigint "
+                "FROM pg_class WHERE relname IN (:live, :archive)"
+            ),
+            {"live": Trade.__tablename__, "archive": TradeArchive.__tablename__}
         )
-        winning = winning_result.scalar()
-
-        win_rate = (winning / closed_count * 100) if closed_count > 0 else 0
-
-        premium_result = await self.db.execute(
-            select(func.avg(Trade.premium_received)).where(Trade.premium_received.isnot(None))
+        # reltuples is -1 until the table has been vacuumed/analyzed at least once
+        if tables != 2 or lowest < 0:
+            return None
+        return estimate
+
+    @staticmethod
+    def _stats_rows(since: Optional[datetime] = None):
+        """Live and archived trades as one row source; archival only moves closed
+        trades out of trades, so the totals must read both to stay stable"""
+        live = select(Trade.status, Trade.pnl, Trade.premium_received)
+        archived = select(TradeArchive.status, TradeArchive.pnl, TradeArchive.premium_received)
+        if since is not None:
+            # Bounding by opened_at keeps both scans on the recent index range
+            live = live.where(Trade.opened_at >= since)
+            archived = archived.where(TradeArchive.opened_at >= since)
+        return union_all(live, archived).subquery("all_trades")
+
+    async def _count_trades(self, since: Optional[datetime] = None) -> int:
+        return await self._scalar(select(func.count()).select_from(self._stats_rows(since)))
+
+    async def _total_trades(self, exact: bool, since: Optional[datetime] = None) -> int:
+        # The pg_class estimate covers the whole table, so a time window needs a real count
+        total = None if exact or since is not None else await self._estimate_trade_count()
+        if total is None:
+            total = await self._count_trades(since)
+        return total
+
+    async def get_trade_stats(self, exact: bool = False, since: Optional[datetime] = None) -> dict:
+        # Bounding by opened_at keeps the aggregates on the recent index range
+        window = (Trade.opened_at >= since,) if since is not None else ()
+        rows = self._stats_rows(since)
+
+        # Closed-trade count, P&L and win rate come out of one aggregate pass;
+        # NULL pnl counts as a non-winning closed trade, as before.
+        closed_stmt = select(
+            func.count(),
+            func.coalesce(func.sum(rows.c.pnl), 0),
+            func.coalesce(func.avg(case((rows.c.pnl > 0, 100.0), else_=0.0)), 0),
+        ).where(rows.c.status == "closed")
+
+        # Open trades are never archived, so that count stays on the live table
+        total, open_count, closed_row, avg_premium = await asyncio.gather(
+            self._total_trades(exact, since),
+            self._scalar(select(func.count()).select_from(Trade).where(Trade.status == "open", *window)),
+            self._one(closed_stmt),
+            self._scalar(
+                select(func.avg(rows.c.premium_received)).where(rows.c.premium_received.isnot(None))
+            ),
         )
-        avg_premium = premium_result.scalar() or 0
+        closed_count, total_pnl, win_rate = closed_row
 
         return {
             "total_trades": total,
@@ -196,5 +344,5 @@ class AgentService:
             "closed_trades": closed_count,
             "total_pnl": total_pnl,
             "win_rate": win_rate,
-            "avg_premium": avg_premium
+            "avg_premium": avg_premium or 0
         }
@@ -6,9 +6,14 @@ Requires IB Gateway or TWS running with API enabled.
 """
 
 import asyncio
+import time
+import numpy as np
 import structlog
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from itertools import product
+from math import isfinite
+from typing import Optional, List, Dict, Set, Any
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from dataclasses import dataclass
 
 try:
@@ -22,8 +27,42 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# accountSummary() tags mapped onto AccountSummary fields
+_ACCOUNT_SUMMARY_TAGS = frozenset({
+    "NetLiquidation",
+    "BuyingPower",
+    "AvailableFunds",
+    "ExcessLiquidity",
+    "MaintMarginReq",
+    "UnrealizedPnL",
+    "RealizedPnL",
+})
 
-@dataclass
+# Default +/- distance from the underlying price for strikes in get_option_chain
+OPTION_STRIKE_BAND = 10.0
+
+# Option market data lines held at once; IB's default allowance is 100 concurrent lines,
+# so larger chains are quoted in chunks that are cancelled before the next one starts
+OPTION_MARKET_DATA_LINES = 90
+
+# Contracts per qualifyContractsAsync call; larger chains are split and qualified concurrently
+QUALIFY_BATCH_SIZE = 200
+
+# Option chain definitions (expirations/strikes) change at most once per trading day
+OPTION_CHAIN_TTL_SECONDS = 6 * 3600
+
+
+@lru_cache(maxsize=2)
+def _next_friday_expiry(today_ordinal: int, after_close: bool) -> str:
+    """Next weekly (Friday) expiration as YYYYMMDD; rolls a week once Friday's close has passed"""
+    today = date.fromordinal(today_ordinal)
+    days_until_friday = (4 - today.weekday()) % 7
+    if days_until_friday == 0 and after_close:
+        days_until_friday = 7
+    return (today + timedelta(days=days_until_friday)).strftime("%Y%m%d")
+
+
+@dataclass(slots=True, frozen=True)
 class OptionQuote:
     symbol: str
     expiration: str
@@ -41,7 +80,7 @@ class OptionQuote:
     vega: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     symbol: str
     contract_type: str
@@ -52,7 +91,7 @@ class Position:
     realized_pnl: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AccountSummary:
     account_id: str
     net_liquidation: float
@@ -64,6 +103,17 @@ class AccountSummary:
     realized_pnl: float
 
 
+@dataclass(slots=True, frozen=True)
+class OpenOrder:
+    order_id: int
+    symbol: str
+    action: str
+    quantity: float
+    order_type: str
+    limit_price: Optional[float]
+    status: str
+
+
 class IBClient:
     """
     Interactive Brokers API client for options trading.
@@ -90,6 +140,19 @@ class IBClient:
         self.readonly = readonly
         self.ib: Optional[IB] = None
         self._connected = False
+        # conId -> Events of every coroutine waiting on that contract's ticker; the
+        # market data subscription is shared and cancelled when the last waiter leaves
+        self._tick_events: Dict[int, Set[asyncio.Event]] = {}
+        self._tickers: Dict[int, Any] = {}
+        # Qualified stock contracts by symbol and option chain definitions by
+        # (symbol, secType); both are dropped on disconnect
+        self._qualified_stocks: Dict[str, Contract] = {}
+        self._chain_cache: Dict[tuple, tuple] = {}  # key -> (fetched_at, chains)
+        # (symbol, expiration, strike, right) -> qualified option contract seen this session
+        self._qualified_options: Dict[tuple, Contract] = {}
+        # Open trades indexed by orderId and by symbol, kept current by order events
+        self._open_trades: Dict[int, Any] = {}
+        self._open_order_ids_by_symbol: Dict[str, Set[int]] = {}
 
     async def connect(self) -> bool:
         """Connect to IB Gateway/TWS"""
@@ -102,6 +165,12 @@ class IBClient:
                 readonly=self.readonly
             )
             self._connected = True
+            self.ib.pendingTickersEvent += self._on_pending_tickers
+            self.ib.newOrderEvent += self._index_trade
+            self.ib.openOrderEvent += self._index_trade
+            self.ib.orderStatusEvent += self._on_order_status
+            for trade in self.ib.openTrades():
+                self._index_trade(trade)
 
             # Request delayed market data (type 3) if live data subscription not available
             # Type 1 = Live, Type 2 = Frozen, Type 3 = Delayed, Type 4 = Delayed-Frozen
@@ -118,12 +187,125 @@ class IBClient:
         if self.ib and self._connected:
             self.ib.disconnect()
             self._connected = False
+            self._qualified_stocks.clear()
+            self._chain_cache.clear()
+            self._qualified_options.clear()
+            self._open_trades.clear()
+            self._open_order_ids_by_symbol.clear()
+            self._tick_events.clear()
+            self._tickers.clear()
             logger.info("Disconnected from Interactive Brokers")
 
     @property
     def is_connected(self) -> bool:
         return self._connected and self.ib and self.ib.isConnected()
 
+    def _index_trade(self, trade):
+        """Add a live order to the open-order index"""
+        # TWS can send openOrder after the final orderStatus; a done trade must stay evicted
+        if trade.isDone():
+            self._on_order_status(trade)
+            return
+        order_id = trade.order.orderId
+        self._open_trades[order_id] = trade
+        self._open_order_ids_by_symbol.setdefault(trade.contract.symbol, set()).add(order_id)
+
+    def _on_order_status(self, trade):
+        """Drop filled/cancelled orders from the open-order index"""
+        if not trade.isDone():
+            return
+        order_id = trade.order.orderId
+        self._open_trades.pop(order_id, None)
+        order_ids = self._open_order_ids_by_symbol.get(trade.contract.symbol)
+        if order_ids is not None:
+            order_ids.discard(order_id)
+            if not order_ids:
+                del self._open_order_ids_by_symbol[trade.contract.symbol]
+
+    def _on_pending_tickers(self, tickers):
+        """Wake any coroutine waiting on one of the updated tickers"""
+        for ticker in tickers:
+            for event in self._tick_events.get(ticker.contract.conId, ()):
+                event.set()
+
+    def _watch_ticks(self, contract: Contract, event: asyncio.Event, generic_ticks: str = ""):
+        """Set event on the contract's ticker updates, subscribing on the first waiter; returns the ticker"""
+        watchers = self._tick_events.get(contract.conId)
+        if watchers is None:
+            watchers = self._tick_events[contract.conId] = set()
+            self._tickers[contract.conId] = self.ib.reqMktData(contract, generic_ticks, False, False)
+        watchers.add(event)
+        return self._tickers[contract.conId]
+
+    def _unwatch_ticks(self, contract: Contract, event: asyncio.Event):
+        """Stop setting event; cancels the market data once no waiter remains"""
+        watchers = self._tick_events.get(contract.conId)
+        if watchers is None:
+            return
+        watchers.discard(event)
+        if not watchers:
+            del self._tick_events[contract.conId]
+            self._tickers.pop(contract.conId, None)
+            self.ib.cancelMktData(contract)
+
+    @staticmethod
+    def _ticker_price(ticker) -> Optional[float]:
+        """Best available price: marketPrice, then bid/ask midpoint, then last, then close"""
+        bid, ask = ticker.bid, ticker.ask
+        mid = (bid + ask) / 2 if bid and ask and bid > 0 and ask > 0 else None
+        for candidate in (ticker.marketPrice(), mid, ticker.last, ticker.close):
+            if candidate and candidate > 0 and isfinite(candidate):
+                return candidate
+        return None
+
+    @staticmethod
+    def _option_ticker_ready(ticker) -> bool:
+        return ticker.modelGreeks is not None and ticker.bid > 0 and ticker.ask > 0
+
+    async def _wait_for_tick(self, event: asyncio.Event, deadline: float) -> bool:
+        """Wait for the next ticker update until the loop-time deadline; False on timeout"""
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            return False
+        try:
+            await asyncio.wait_for(event.wait(), remaining)
+        except asyncio.TimeoutError:
+            return False
+        event.clear()
+        return True
+
+    async def _qualify_stock(self, symbol: str) -> Optional[Contract]:
+        """Qualified SMART/USD stock contract, cached per symbol for the session"""
+        contract = self._qualified_stocks.get(symbol)
+        if contract is None:
+            qualified = await self.ib.qualifyContractsAsync(Stock(symbol, "SMART", "USD"))
+            if not qualified:
+                return None
+            contract = qualified[0]
+            self._qualified_stocks[symbol] = contract
+        return contract
+
+    def _remember_option(self, opt: Contract):
+        key = (opt.symbol, opt.lastTradeDateOrContractMonth, opt.strike, opt.right)
+        self._qualified_options[key] = opt
+
+    async def _get_option_chains(self, underlying: Contract) -> list:
+        """reqSecDefOptParams for the underlying, cached for OPTION_CHAIN_TTL_SECONDS"""
+        key = (underlying.symbol, underlying.secType)
+        cached = self._chain_cache.get(key)
+        if cached and time.monotonic() - cached[0] < OPTION_CHAIN_TTL_SECONDS:
+            return cached[1]
+
+        chains = await self.ib.reqSecDefOptParamsAsync(
+            underlying.symbol,
+            "",
+            underlying.secType,
+            underlying.conId
+        )
+        if chains:
+            self._chain_cache[key] = (time.monotonic(), chains)
+        return chains
+
     async def get_account_summary(self) -> Optional[AccountSummary]:
         """Get account summary including buying power and P&L"""
         if not self.is_connected:
@@ -132,9 +314,12 @@ class IBClient:
         try:
             account_values = self.ib.accountSummary()
 
-            values = {}
-            for av in account_values:
-                values[av.tag] = float(av.value) if av.value else 0.0
+            # Only convert the tags AccountSummary uses; the rest include non-numeric values
+            values = {
+                av.tag: float(av.value) if av.value else 0.0
+                for av in account_values
+                if av.tag in _ACCOUNT_SUMMARY_TAGS
+            }
 
             return AccountSummary(
                 account_id=settings.BROKER_ACCOUNT_ID or "default",
@@ -182,37 +367,22 @@ class IBClient:
             return None
 
         try:
-            contract = Stock("QQQ", "SMART", "USD")
-
-            # Use qualifyContractsAsync for async compatibility
-            await self.ib.qualifyContractsAsync(contract)
-
-            # Request market data
-            ticker = self.ib.reqMktData(contract, "", False, False)
-
-            # Wait for data with timeout (5 seconds for delayed data)
-            price = None
-            for _ in range(50):  # 5 second timeout (50 * 0.1s)
-                await asyncio.sleep(0.1)
-                # Try marketPrice first (uses last, then close, then bid/ask midpoint)
-                mp = ticker.marketPrice()
-                if mp and mp > 0 and not (mp != mp):  # Check for NaN
-                    price = mp
-                    break
-                # Also check if we have bid/ask
-                if ticker.bid and ticker.ask and ticker.bid > 0 and ticker.ask > 0:
-                    price = (ticker.bid + ticker.ask) / 2
-                    break
-                # Check last price
-                if ticker.last and ticker.last > 0:
-                    price = ticker.last
-                    break
-                # Check close price (for delayed/frozen data)
-                if ticker.close and ticker.close > 0:
-                    price = ticker.close
-                    break
+            contract = await self._qualify_stock("QQQ")
+            if not contract:
+                logger.warning("Could not qualify QQQ contract")
+                return None
 
-            self.ib.cancelMktData(contract)
+            # Request market data and wait for tick updates (5 seconds for delayed data)
+            tick_event = asyncio.Event()
+            ticker = self._watch_ticks(contract, tick_event)
+            deadline = asyncio.get_running_loop().time() + 5.0
+
+            try:
+                price = self._ticker_price(ticker)
+                while price is None and await self._wait_for_tick(tick_event, deadline):
+                    price = self._ticker_price(ticker)
+            finally:
+                self._unwatch_ticks(contract, tick_event)
 
             if price and price > 0:
                 logger.info("Got QQQ price from IB", price=price)
@@ -229,12 +399,49 @@ class IBClient:
             logger.error("Failed to get QQQ price", error=str(e))
             return None
 
+    async def _quote_options(self, options: List[Contract]) -> List[OptionQuote]:
+        """Snapshot quotes and greeks for qualified options held within one market data window"""
+        # Request market data for every contract up front, then wait until each
+        # ticker has greeks and a two-sided quote (or the 3 s deadline passes)
+        tick_event = asyncio.Event()
+        try:
+            tickers = [self._watch_ticks(opt, tick_event, "100,101,104,106") for opt in options]
+
+            pending = [t for t in tickers if not self._option_ticker_ready(t)]
+            deadline = asyncio.get_running_loop().time() + 3.0
+            while pending and await self._wait_for_tick(tick_event, deadline):
+                pending = [t for t in pending if not self._option_ticker_ready(t)]
+
+            return [
+                OptionQuote(
+                    symbol=opt.symbol,
+                    expiration=opt.lastTradeDateOrContractMonth,
+                    strike=opt.strike,
+                    right=opt.right,
+                    bid=ticker.bid or 0,
+                    ask=ticker.ask or 0,
+                    last=ticker.last or 0,
+                    volume=ticker.volume or 0,
+                    open_interest=0,
+                    implied_vol=ticker.modelGreeks.impliedVol if ticker.modelGreeks else 0,
+                    delta=ticker.modelGreeks.delta if ticker.modelGreeks else 0,
+                    gamma=ticker.modelGreeks.gamma if ticker.modelGreeks else 0,
+                    theta=ticker.modelGreeks.theta if ticker.modelGreeks else 0,
+                    vega=ticker.modelGreeks.vega if ticker.modelGreeks else 0
+                )
+                for opt, ticker in zip(options, tickers)
+            ]
+        finally:
+            for opt in options:
+                self._unwatch_ticks(opt, tick_event)
+
     async def get_option_chain(
         self,
         symbol: str = "QQQ",
         expiration: str = None,  # Format: YYYYMMDD
         strikes: List[float] = None,
-        right: str = None  # 'C' or 'P'
+        right: str = None,  # 'C' or 'P'
+        strike_band: float = OPTION_STRIKE_BAND
     ) -> List[OptionQuote]:
         """
         Get option chain for a symbol.
@@ -244,67 +451,66 @@ class IBClient:
             expiration: Expiration date in YYYYMMDD format
             strikes: List of strike prices to filter
             right: 'C' for calls, 'P' for puts
+            strike_band: When no strikes are given, only strikes within this
+                distance of the underlying price are requested
         """
         if not self.is_connected:
             return []
 
         try:
-            underlying = Stock(symbol, "SMART", "USD")
-            await self.ib.qualifyContractsAsync(underlying)
+            underlying = await self._qualify_stock(symbol)
+            if not underlying:
+                return []
 
             # Get option chain parameters
-            chains = await self.ib.reqSecDefOptParamsAsync(
-                underlying.symbol,
-                "",
-                underlying.secType,
-                underlying.conId
-            )
+            chains = await self._get_option_chains(underlying)
 
             if not chains:
                 return []
 
             # Use SMART exchange
-            chain = next((c for c in chains if c.exchange == "SMART"), chains[0])
+            chain = {c.exchange: c for c in chains}.get("SMART", chains[0])
 
-            # Build option contracts
-            options = []
-            expirations = [expiration] if expiration else list(chain.expirations)[:4]  # Next 4 expirations
-            target_strikes = strikes if strikes else list(chain.strikes)
+            # Narrow expirations and strikes to ones the chain actually lists before
+            # building contracts, so nothing has to be truncated afterwards
+            chain_expirations = frozenset(chain.expirations)
+            if expiration:
+                expirations = [expiration] if expiration in chain_expirations else []
+            else:
+                expirations = sorted(chain_expirations)[:4]  # Next 4 expirations
+
+            chain_strikes = frozenset(chain.strikes)
+            if strikes:
+                target_strikes = [k for k in strikes if k in chain_strikes]
+            else:
+                spot = await self.get_stock_price(symbol)
+                if not spot:
+                    logger.warning("No underlying price to center option strikes", symbol=symbol)
+                    return []
+                target_strikes = sorted(k for k in chain_strikes if abs(k - spot) <= strike_band)
             rights = [right] if right else ["P", "C"]
 
-            for exp in expirations:
-                for strike in target_strikes:
-                    for r in rights:
-                        opt = Option(symbol, exp, strike, r, "SMART")
-                        options.append(opt)
+            # Build option contracts
+            options = [
+                Option(symbol, exp, strike, r, "SMART")
+                for exp, strike, r in product(expirations, target_strikes, rights)
+            ]
 
-            # Qualify contracts (limit to avoid overload)
-            qualified = await self.ib.qualifyContractsAsync(*options[:50])
+            if not options:
+                return []
 
-            # Request market data
-            quotes = []
-            for opt in qualified:
-                ticker = self.ib.reqMktData(opt, "100,101,104,106", False, False)
-                await asyncio.sleep(0.2)  # Wait for data
+            batches = await asyncio.gather(*(
+                self.ib.qualifyContractsAsync(*options[i:i + QUALIFY_BATCH_SIZE])
+                for i in range(0, len(options), QUALIFY_BATCH_SIZE)
+            ))
+            qualified = [opt for batch in batches for opt in batch]
 
-                quotes.append(OptionQuote(
-                    symbol=opt.symbol,
-                    expiration=opt.lastTradeDateOrContractMonth,
-                    strike=opt.strike,
-                    right=opt.right,
-                    bid=ticker.bid or 0,
-                    ask=ticker.ask or 0,
-                    last=ticker.last or 0,
-                    volume=ticker.volume or 0,
-                    open_interest=0,
-                    implied_vol=ticker.modelGreeks.impliedVol if ticker.modelGreeks else 0,
-                    delta=ticker.modelGreeks.delta if ticker.modelGreeks else 0,
-                    gamma=ticker.modelGreeks.gamma if ticker.modelGreeks else 0,
-                    theta=ticker.modelGreeks.theta if ticker.modelGreeks else 0,
-                    vega=ticker.modelGreeks.vega if ticker.modelGreeks else 0
-                ))
+            for opt in qualified:
+                self._remember_option(opt)
 
-                self.ib.cancelMktData(opt)
+            quotes = []
+            for i in range(0, len(qualified), OPTION_MARKET_DATA_LINES):
+                quotes.extend(await self._quote_options(qualified[i:i + OPTION_MARKET_DATA_LINES]))
 
             return quotes
         except Exception as e:
@@ -331,16 +537,12 @@ class IBClient:
             if not qqq_price:
                 return None
 
-            # Get Friday expiration (next weekly)
-            today = datetime.now()
-            days_until_friday = (4 - today.weekday()) % 7
-            if days_until_friday == 0 and today.hour >= 16:
-                days_until_friday = 7
-            expiration_date = today + timedelta(days=days_until_friday)
-            expiration = expiration_date.strftime("%Y%m%d")
+            # Get Friday expiration (next weekly); cached per day and side of the close
+            now = datetime.now()
+            expiration = _next_friday_expiry(now.toordinal(), now.hour >= 16)
 
             # Generate strike range (below current price)
-            strikes = [round(qqq_price - i, 0) for i in range(5, 50, 1)]
+            strikes = np.round(qqq_price - np.arange(5, 50)).tolist()
 
             # Get put options
             puts = await self.get_option_chain(
@@ -349,38 +551,53 @@ class IBClient:
                 strikes=strikes,
                 right="P"
             )
+            if not puts:
+                return None
 
-            # Find short put with target credit and delta
-            for put in sorted(puts, key=lambda x: x.strike, reverse=True):
+            # Column arrays over the chain so the credit/delta screen is one vectorized pass
+            n = len(puts)
+            strike_arr = np.fromiter((p.strike for p in puts), dtype=np.float64, count=n)
+            bid_arr = np.fromiter((p.bid for p in puts), dtype=np.float64, count=n)
+            ask_arr = np.fromiter((p.ask for p in puts), dtype=np.float64, count=n)
+            delta_arr = np.fromiter((p.delta for p in puts), dtype=np.float64, count=n)
+            mid_arr = 0.5 * (bid_arr + ask_arr)
+
+            qualifies = (
+                (mid_arr >= target_credit_min)
+                & (mid_arr <= target_credit_max)
+                & (np.abs(delta_arr) <= max_delta)
+            )
+
+            # Strike index for the long-leg lookup, built once per call
+            puts_by_strike = {p.strike: p for p in puts}
+
+            # Find short put with target credit and delta, highest strike first
+            candidates = np.flatnonzero(qualifies)
+            candidates = candidates[np.argsort(-strike_arr[candidates], kind="stable")]
+            for idx in candidates:
+                put = puts[idx]
                 mid_price = (put.bid + put.ask) / 2
-                if (target_credit_min <= mid_price <= target_credit_max and
-                    abs(put.delta) <= max_delta):
-
-                    short_strike = put.strike
-                    long_strike = short_strike - spread_width
-
-                    # Find long put
-                    long_put = next(
-                        (p for p in puts if p.strike == long_strike),
-                        None
-                    )
-
-                    if long_put:
-                        long_mid = (long_put.bid + long_put.ask) / 2
-                        net_credit = mid_price - long_mid
-                        max_risk = (spread_width - net_credit) * 100
-
-                        return {
-                            "short_strike": short_strike,
-                            "long_strike": long_strike,
-                            "short_premium": mid_price,
-                            "long_premium": long_mid,
-                            "net_credit": net_credit,
-                            "max_risk": max_risk,
-                            "short_delta": put.delta,
-                            "expiration": expiration,
-                            "qqq_price": qqq_price
-                        }
+                short_strike = put.strike
+                long_strike = short_strike - spread_width
+
+                # Find long put
+                long_put = puts_by_strike.get(long_strike)
+                if long_put:
+                    long_mid = (long_put.bid + long_put.ask) / 2
+                    net_credit = mid_price - long_mid
+                    max_risk = (spread_width - net_credit) * 100
+
+                    return {
+                        "short_strike": short_strike,
+                        "long_strike": long_strike,
+                        "short_premium": mid_price,
+                        "long_premium": long_mid,
+                        "net_credit": net_credit,
+                        "max_risk": max_risk,
+                        "short_delta": put.delta,
+                        "expiration": expiration,
+                        "qqq_price": qqq_price
+                    }
 
             return None
         except Exception as e:
@@ -406,11 +623,23 @@ class IBClient:
             return None
 
         try:
-            # Create option contracts
-            short_opt = Option("QQQ", expiration, short_strike, right, "SMART")
-            long_opt = Option("QQQ", expiration, long_strike, right, "SMART")
-
-            await self.ib.qualifyContractsAsync(short_opt, long_opt)
+            # Resolve leg conIds, qualifying only the legs not already seen in get_option_chain
+            short_key = ("QQQ", expiration, float(short_strike), right)
+            long_key = ("QQQ", expiration, float(long_strike), right)
+            missing = [
+                Option(*key, "SMART")
+                for key in (short_key, long_key)
+                if key not in self._qualified_options
+            ]
+            if missing:
+                for opt in await self.ib.qualifyContractsAsync(*missing):
+                    self._remember_option(opt)
+
+            short_opt = self._qualified_options.get(short_key)
+            long_opt = self._qualified_options.get(long_key)
+            if not short_opt or not long_opt:
+                logger.error("Failed to qualify spread legs", short_strike=short_strike, long_strike=long_strike)
+                return None
 
             # Create combo contract for spread
             combo = Contract()
@@ -473,7 +702,7 @@ class IBClient:
             logger.error("Failed to close position", error=str(e))
             return None
 
-    async def get_open_orders(self) -> List[Dict[str, Any]]:
+    async def get_open_orders(self) -> List[OpenOrder]:
         """Get all open orders"""
         if not self.is_connected:
             return []
@@ -481,15 +710,15 @@ class IBClient:
         try:
             orders = self.ib.openOrders()
             return [
-                {
-                    "order_id": o.orderId,
-                    "symbol": o.contract.symbol if hasattr(o, 'contract') else "",
-                    "action": o.action,
-                    "quantity": o.totalQuantity,
-                    "order_type": o.orderType,
-                    "limit_price": o.lmtPrice if hasattr(o, 'lmtPrice') else None,
-                    "status": o.status if hasattr(o, 'status') else "unknown"
-                }
+                OpenOrder(
+                    order_id=o.orderId,
+                    symbol=contract.symbol if (contract := getattr(o, 'contract', None)) else "",
+                    action=o.action,
+                    quantity=o.totalQuantity,
+                    order_type=o.orderType,
+                    limit_price=getattr(o, 'lmtPrice', None),
+                    status=getattr(o, 'status', "unknown")
+                )
                 for o in orders
             ]
         except Exception as e:
@@ -502,10 +731,9 @@ class IBClient:
             return False
 
         try:
-            orders = self.ib.openOrders()
-            order = next((o for o in orders if o.orderId == order_id), None)
-            if order:
-                self.ib.cancelOrder(order)
+            trade = self._open_trades.get(order_id)
+            if trade:
+                self.ib.cancelOrder(trade.order)
                 return True
             return False
         except Exception as e:
@@ -522,30 +750,21 @@ class IBClient:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
-            await self.ib.qualifyContractsAsync(contract)
-
-            ticker = self.ib.reqMktData(contract, "", False, False)
-
-            # Wait for data with timeout
-            price = None
-            for _ in range(50):  # 5 second timeout
-                await asyncio.sleep(0.1)
-                mp = ticker.marketPrice()
-                if mp and mp > 0 and not (mp != mp):  # Check for NaN
-                    price = mp
-                    break
-                if ticker.bid and ticker.ask and ticker.bid > 0 and ticker.ask > 0:
-                    price = (ticker.bid + ticker.ask) / 2
-                    break
-                if ticker.last and ticker.last > 0:
-                    price = ticker.last
-                    break
-                if ticker.close and ticker.close > 0:
-                    price = ticker.close
-                    break
+            contract = await self._qualify_stock(symbol)
+            if not contract:
+                return None
 
-            self.ib.cancelMktData(contract)
+            tick_event = asyncio.Event()
+            ticker = self._watch_ticks(contract, tick_event)
+            deadline = asyncio.get_running_loop().time() + 5.0
+
+            # Wait for tick updates with timeout
+            try:
+                price = self._ticker_price(ticker)
+                while price is None and await self._wait_for_tick(tick_event, deadline):
+                    price = self._ticker_price(ticker)
+            finally:
+                self._unwatch_ticks(contract, tick_event)
 
             if price and price > 0:
                 logger.debug("Got stock price", symbol=symbol, price=price)
@@ -555,15 +774,61 @@ class IBClient:
             logger.error("Failed to get stock price", symbol=symbol, error=str(e))
             return None
 
+    async def get_stock_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several stocks in one batch.
+
+        All contracts are qualified in a single call and their market data is
+        requested together, so the wait is bounded by the slowest ticker rather
+        than the sum of per-symbol waits. Symbols without a price are omitted.
+        """
+        if not self.is_connected or not symbols:
+            return {}
+
+        try:
+            symbols = list(dict.fromkeys(symbols))
+            unqualified = {s: Stock(s, "SMART", "USD") for s in symbols if s not in self._qualified_stocks}
+            if unqualified:
+                await self.ib.qualifyContractsAsync(*unqualified.values())
+                for symbol, contract in unqualified.items():
+                    if contract.conId:
+                        self._qualified_stocks[symbol] = contract
+
+            contracts = {s: self._qualified_stocks[s] for s in symbols if s in self._qualified_stocks}
+
+            tick_event = asyncio.Event()
+            pending = {
+                symbol: self._watch_ticks(contract, tick_event)
+                for symbol, contract in contracts.items()
+            }
+
+            prices = {}
+            deadline = asyncio.get_running_loop().time() + 3.0
+            try:
+                while pending:
+                    for symbol, ticker in list(pending.items()):
+                        price = self._ticker_price(ticker)
+                        if price:
+                            prices[symbol] = price
+                            del pending[symbol]
+                    if not pending or not await self._wait_for_tick(tick_event, deadline):
+                        break
+            finally:
+                for contract in contracts.values():
+                    self._unwatch_ticks(contract, tick_event)
+
+            return prices
+        except Exception as e:
+            logger.error("Failed to get stock prices", symbols=symbols, error=str(e))
+            return {}
+
     async def create_stock_contract(self, symbol: str) -> Optional[Contract]:
         """Create and qualify a stock contract"""
         if not self.is_connected:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
-            qualified = await self.ib.qualifyContractsAsync(contract)
-            return qualified[0] if qualified else None
+            return await self._qualify_stock(symbol)
         except Exception as e:
             logger.error("Failed to create stock contract", symbol=symbol, error=str(e))
             return None
@@ -581,9 +846,15 @@ class IBClient:
 
         try:
             right = "C" if option_type.upper() == "CALL" else "P"
-            contract = Option(symbol, expiry, strike, right, "SMART")
-            qualified = await self.ib.qualifyContractsAsync(contract)
-            return qualified[0] if qualified else None
+            key = (symbol, expiry, float(strike), right)
+            contract = self._qualified_options.get(key)
+            if contract is None:
+                qualified = await self.ib.qualifyContractsAsync(Option(*key, "SMART"))
+                if not qualified:
+                    return None
+                contract = qualified[0]
+                self._remember_option(contract)
+            return contract
         except Exception as e:
             logger.error("Failed to create option contract", symbol=symbol, error=str(e))
             return None
@@ -703,7 +974,7 @@ class IBClient:
                 action=exit_action,
                 totalQuantity=quantity,
                 lmtPrice=take_profit_price,
-                parentId=0,  # Will be set after parent is placed
+                parentId=0,  # Set once the parent id is reserved
                 transmit=False
             )
 
@@ -716,13 +987,13 @@ class IBClient:
             stop_loss.parentId = 0
             stop_loss.transmit = True  # Transmit all orders
 
-            # Place orders
-            parent_trade = self.ib.placeOrder(contract, parent)
-            parent_id = parent_trade.order.orderId
-
-            take_profit.parentId = parent_id
-            stop_loss.parentId = parent_id
+            # Reserve the parent id up front so all three orders go out back-to-back;
+            # placeOrder is non-blocking and only the last (transmit=True) releases them
+            parent.orderId = self.ib.client.getReqId()
+            take_profit.parentId = parent.orderId
+            stop_loss.parentId = parent.orderId
 
+            parent_trade = self.ib.placeOrder(contract, parent)
             tp_trade = self.ib.placeOrder(contract, take_profit)
             sl_trade = self.ib.placeOrder(contract, stop_loss)
 
@@ -751,15 +1022,15 @@ class IBClient:
             return 0
 
         try:
-            orders = self.ib.openOrders()
-            cancelled = 0
+            if symbol is None:
+                order_ids = list(self._open_trades)
+            else:
+                order_ids = list(self._open_order_ids_by_symbol.get(symbol, ()))
 
-            for order in orders:
-                if symbol is None or (hasattr(order, 'contract') and order.contract.symbol == symbol):
-                    self.ib.cancelOrder(order)
-                    cancelled += 1
+            for order_id in order_ids:
+                self.ib.cancelOrder(self._open_trades[order_id].order)
 
-            return cancelled
+            return len(order_ids)
         except Exception as e:
             logger.error("Failed to cancel orders", error=str(e))
             return 0
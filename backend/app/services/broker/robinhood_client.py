@@ -5,7 +5,7 @@ Official Robinhood Crypto Trading API client using ED25519 signatures.
 API Documentation: https://docs.robinhood.com/crypto/trading/
 
 Authentication:
-- Uses ED25519 cryptographic signatures via PyNaCl
+- Uses ED25519 cryptographic signatures via cryptography (OpenSSL), falling back to PyNaCl
 - API key and private key required (generate from Robinhood developer portal)
 - Private key should be base64-encoded
 
@@ -17,32 +17,81 @@ Rate Limits:
 import asyncio
 import base64
 import json
+import os
+import random
+import sys
 import time
-import uuid
 from decimal import Decimal
 from datetime import datetime
+from base64 import b64encode
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Tuple, Union, Any
+from urllib.parse import urlencode
 
 import httpx
 import structlog
 
+try:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+    OPENSSL_SIGNING = True
+except ImportError:
+    OPENSSL_SIGNING = False
+
 try:
     from nacl.signing import SigningKey
-    CRYPTO_AVAILABLE = True
+    NACL_AVAILABLE = True
 except ImportError:
-    CRYPTO_AVAILABLE = False
+    NACL_AVAILABLE = False
+
+CRYPTO_AVAILABLE = OPENSSL_SIGNING or NACL_AVAILABLE
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+try:
+    # C parser; handles the API's trailing "Z" without a string rewrite
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    if sys.version_info >= (3, 11):
+        # fromisoformat accepts a trailing "Z" natively from 3.11
+        _parse_dt = datetime.fromisoformat
+    else:
+        def _parse_dt(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 from app.core.config import settings
 
 logger = structlog.get_logger()
 
 
+# Pre-encoded HTTP methods for the signature message
+_METHOD_BYTES = {"GET": b"GET", "POST": b"POST", "DELETE": b"DELETE"}
+
+
+def _new_client_order_id() -> str:
+    """Random RFC 4122 version-4 UUID string, formatted without building a uuid.UUID"""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 # ============================================================
 # Data Classes
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CryptoAccount:
     """Robinhood crypto account info"""
     account_id: str
@@ -52,7 +101,7 @@ class CryptoAccount:
     is_active: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CryptoHolding:
     """Crypto holding/position"""
     asset_code: str  # e.g., "BTC"
@@ -63,7 +112,7 @@ class CryptoHolding:
     market_value: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CryptoQuote:
     """Crypto price quote"""
     symbol: str
@@ -77,7 +126,7 @@ class CryptoQuote:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CryptoOrder:
     """Crypto order"""
     id: str
@@ -94,7 +143,7 @@ class CryptoOrder:
     updated_at: Optional[datetime]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingPair:
     """Available crypto trading pair"""
     symbol: str
@@ -115,11 +164,17 @@ class RobinhoodCryptoClient:
     """
     Official Robinhood Crypto Trading API client.
 
-    Uses ED25519 signatures for authentication via PyNaCl.
+    Uses ED25519 signatures for authentication via cryptography, or PyNaCl if unavailable.
     Requires ROBINHOOD_API_KEY and ROBINHOOD_PRIVATE_KEY environment variables.
     """
 
     BASE_URL = "https://trading.robinhood.com"
+    QUOTE_CONCURRENCY = 10  # Max in-flight quote requests in get_quotes
+    MAX_ATTEMPTS = 3  # Tries per request on transient (429/5xx) responses
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_RETRY_AFTER = 5.0  # Seconds; cap on a server-provided Retry-After
+    ACCOUNT_CACHE_TTL = 60.0  # Seconds; buying power moves with fills
+    TRADING_PAIRS_CACHE_TTL = 3600.0  # Seconds; pair listings change on the order of days
 
     def __init__(
         self,
@@ -127,13 +182,30 @@ class RobinhoodCryptoClient:
         private_key_base64: Optional[str] = None
     ):
         if not CRYPTO_AVAILABLE:
-            raise ImportError("pynacl package is not installed. Run: pip install pynacl")
+            raise ImportError("cryptography or pynacl package is required. Run: pip install cryptography")
 
         self.api_key = api_key or settings.ROBINHOOD_API_KEY
         self._private_key_base64 = private_key_base64 or settings.ROBINHOOD_PRIVATE_KEY
-        self._private_key: Optional[SigningKey] = None
+        self._private_key = None
+        # Bound once the key loads: message bytes -> raw 64-byte signature
+        self._sign_fn = None
         self._http_client: Optional[httpx.AsyncClient] = None
         self._account_id: Optional[str] = None
+        # (monotonic fetch time, value) for responses that rarely change
+        self._account_cache: Optional[Tuple[float, CryptoAccount]] = None
+        self._pairs_cache: Optional[Tuple[float, List[TradingPair]]] = None
+        # Constant prefix of every signature message, encoded once
+        self._api_key_bytes = (self.api_key or "").encode("ascii")
+        # Last signed second and its header/message renderings, reused within that second
+        self._last_ts = 0
+        self._last_ts_str = ""
+        self._last_ts_bytes = b""
+        # Headers that don't change between requests; extended with the per-request signature
+        self._base_headers = (
+            ("x-api-key", self.api_key),
+            ("Content-Type", "application/json; charset=utf-8"),
+        )
+        self._unsigned_headers = [("Content-Type", "application/json; charset=utf-8")]
 
         # Load private key
         if self._private_key_base64:
@@ -145,8 +217,17 @@ class RobinhoodCryptoClient:
                     key_b64 += '=' * (4 - padding_needed)
 
                 key_bytes = base64.b64decode(key_b64)
-                # Use PyNaCl SigningKey - it expects the 32-byte seed directly
-                self._private_key = SigningKey(key_bytes)
+                # Both backends take the 32-byte seed directly.
+                # Decoded once here and reused for every request signature.
+                if OPENSSL_SIGNING:
+                    # cryptography returns the raw 64-byte signature
+                    self._private_key = Ed25519PrivateKey.from_private_bytes(key_bytes)
+                    self._sign_fn = self._private_key.sign
+                else:
+                    # PyNaCl returns a SignedMessage; keep just the signature, not the message
+                    self._private_key = SigningKey(key_bytes)
+                    nacl_sign = self._private_key.sign
+                    self._sign_fn = lambda message: nacl_sign(message).signature
                 logger.info("Robinhood private key loaded successfully", key_len=len(key_bytes))
             except Exception as e:
                 logger.error("Failed to load Robinhood private key", error=str(e))
@@ -156,105 +237,165 @@ class RobinhoodCryptoClient:
         """Check if client has valid credentials"""
         return bool(self.api_key and self._private_key)
 
-    def _get_timestamp(self) -> int:
-        """Get current timestamp in seconds"""
-        return int(time.time())
-
-    def _sign_message(self, message: str) -> str:
-        """Sign a message with ED25519 private key using PyNaCl"""
-        if not self._private_key:
+    def _sign_message(self, message: bytes) -> str:
+        """Sign a message with the ED25519 private key"""
+        sign = self._sign_fn
+        if sign is None:
             raise ValueError("Private key not loaded")
-
-        # Use PyNaCl to sign - returns SignedMessage object
-        signed = self._private_key.sign(message.encode('utf-8'))
-        # Extract just the signature (first 64 bytes), not the message
-        return base64.b64encode(signed.signature).decode('utf-8')
+        return b64encode(sign(message)).decode('ascii')
 
     def _create_auth_headers(
         self,
         method: str,
         path: str,
-        body: Optional[str] = None
-    ) -> Dict[str, str]:
+        body: Optional[bytes] = None,
+        signed: bool = True
+    ) -> List[Tuple[str, str]]:
         """
         Create authentication headers for API request.
 
         The signature message format is:
         {api_key}{timestamp}{path}{method}{body}
-        """
-        timestamp = self._get_timestamp()
-        body_str = body or ""
 
-        # Build message to sign - format: api_key + timestamp + path + method + body
-        message = f"{self.api_key}{timestamp}{path}{method}{body_str}"
+        With signed=False only the Content-Type header is returned.
+        """
+        if not signed:
+            return self._unsigned_headers
+
+        # Unix seconds, formatted once per second for both the signed message and the header
+        ts = time.time_ns() // 1_000_000_000
+        if ts != self._last_ts:
+            self._last_ts = ts
+            self._last_ts_str = str(ts)
+            self._last_ts_bytes = self._last_ts_str.encode("ascii")
+        timestamp = self._last_ts_str
+        body_bytes = body or b""
+
+        # Build message to sign - format: api_key + timestamp + path + method + body.
+        # Assembled directly as bytes; the body is appended exactly as it is sent.
+        message = b"".join((
+            self._api_key_bytes,
+            self._last_ts_bytes,
+            path.encode("utf-8"),
+            _METHOD_BYTES.get(method) or method.encode("ascii"),
+            body_bytes,
+        ))
 
         logger.debug(
             "Creating signature",
-            api_key_prefix=self.api_key[:10] if self.api_key else None,
             timestamp=timestamp,
             path=path,
             method=method,
-            body_len=len(body_str),
+            body_len=len(body_bytes),
             message_len=len(message)
         )
 
         signature = self._sign_message(message)
 
-        headers = {
-            "x-api-key": self.api_key,
-            "x-timestamp": str(timestamp),
-            "x-signature": signature,
-            "Content-Type": "application/json; charset=utf-8",
-        }
+        # httpx takes header pairs as-is, so no dict is built per request
+        return [*self._base_headers, ("x-timestamp", timestamp), ("x-signature", signature)]
 
-        return headers
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Build the HTTP/2 client (one TLS session reused across requests)"""
+        return httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+            timeout=httpx.Timeout(10.0, connect=3.0)
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
-                base_url=self.BASE_URL,
-                timeout=30.0
-            )
+        """Get the persistent HTTP client; created lazily only outside the app lifespan"""
+        if self._http_client is None:
+            self._http_client = self._create_http_client()
         return self._http_client
 
     async def _request(
         self,
         method: str,
         path: str,
-        body: Optional[Dict] = None
+        body: Optional[Dict] = None,
+        signed: bool = True,
+        params: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None
     ) -> Dict[str, Any]:
-        """Make authenticated API request"""
+        """
+        Make API request, signed unless signed=False.
+
+        params (a dict or a list of pairs for repeated keys) are encoded once into
+        the path, so the signed path is exactly the one sent. None values are dropped.
+        """
         if not self.is_configured:
             raise ValueError("Robinhood client not configured. Check API key and private key.")
 
+        if params:
+            pairs = params.items() if isinstance(params, dict) else params
+            query = urlencode([(k, v) for k, v in pairs if v is not None])
+            if query:
+                path = f"{path}?{query}"
+
         client = await self._get_client()
-        body_str = json.dumps(body) if body else None
-        headers = self._create_auth_headers(method, path, body_str)
+        body_bytes = _dumps(body) if body else None
+        # A 5xx on a POST may already have placed the order, so POSTs only retry on 429
+        retry_statuses = self.RETRY_STATUSES if method != "POST" else frozenset({429})
 
-        try:
-            if method == "GET":
-                response = await client.get(path, headers=headers)
-            elif method == "POST":
-                response = await client.post(path, headers=headers, content=body_str)
-            elif method == "DELETE":
-                response = await client.delete(path, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        for attempt in range(self.MAX_ATTEMPTS):
+            # Signed per attempt so a retry carries a fresh timestamp
+            headers = self._create_auth_headers(method, path, body_bytes, signed)
+            try:
+                if method == "GET":
+                    response = await client.get(path, headers=headers)
+                elif method == "POST":
+                    response = await client.post(path, headers=headers, content=body_bytes)
+                elif method == "DELETE":
+                    response = await client.delete(path, headers=headers)
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+
+                response.raise_for_status()
+                logger.debug("Robinhood response", path=path, http_version=response.http_version)
+                return _loads(response.content)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status in retry_statuses and attempt + 1 < self.MAX_ATTEMPTS:
+                    delay = self._retry_delay(e.response, attempt)
+                    logger.warning(
+                        "Robinhood transient error, retrying",
+                        status=status,
+                        path=path,
+                        attempt=attempt + 1,
+                        delay=delay
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(
+                    "Robinhood API error",
+                    status=status,
+                    body=e.response.text,
+                    path=path
+                )
+                raise
+            except Exception as e:
+                logger.error("Robinhood request failed", error=str(e), path=path)
+                raise
 
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                "Robinhood API error",
-                status=e.response.status_code,
-                body=e.response.text,
-                path=path
-            )
-            raise
-        except Exception as e:
-            logger.error("Robinhood request failed", error=str(e), path=path)
-            raise
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before a retry: Retry-After if given, else exponential backoff with jitter"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), self.MAX_RETRY_AFTER)
+            except ValueError:
+                pass
+        return 0.1 * 2 ** attempt + random.random() * 0.1
+
+    async def startup(self):
+        """Open the HTTP client up front; called from the FastAPI lifespan"""
+        if self._http_client is None:
+            self._http_client = self._create_http_client()
+
+    async def shutdown(self):
+        """Close the HTTP client; called from the FastAPI lifespan"""
+        await self.close()
 
     async def close(self):
         """Close HTTP client"""
@@ -262,12 +403,24 @@ class RobinhoodCryptoClient:
             await self._http_client.aclose()
             self._http_client = None
 
+    async def aclose(self):
+        """Alias for close() so the client works with contextlib.aclosing"""
+        await self.close()
+
+    def invalidate(self):
+        """Drop cached account and trading pair data so the next call refetches"""
+        self._account_cache = None
+        self._pairs_cache = None
+
     # ============================================================
     # Account Methods
     # ============================================================
 
     async def get_account(self) -> Optional[CryptoAccount]:
-        """Get crypto trading account"""
+        """Get crypto trading account (cached for ACCOUNT_CACHE_TTL seconds)"""
+        if self._account_cache and time.monotonic() - self._account_cache[0] < self.ACCOUNT_CACHE_TTL:
+            return self._account_cache[1]
+
         try:
             data = await self._request("GET", "/api/v1/crypto/trading/accounts/")
 
@@ -282,13 +435,15 @@ class RobinhoodCryptoClient:
 
             self._account_id = account.get("account_number")
 
-            return CryptoAccount(
+            result = CryptoAccount(
                 account_id=account.get("account_number", ""),
                 status=account.get("status", ""),
                 buying_power=float(account.get("buying_power", 0)),
                 buying_power_currency=account.get("buying_power_currency", "USD"),
                 is_active=account.get("status") == "active"
             )
+            self._account_cache = (time.monotonic(), result)
+            return result
         except Exception as e:
             logger.error("Failed to get Robinhood account", error=str(e))
             return None
@@ -298,18 +453,18 @@ class RobinhoodCryptoClient:
         try:
             data = await self._request("GET", "/api/v1/crypto/trading/holdings/")
 
-            holdings = []
-            for h in data.get("results", []):
-                holdings.append(CryptoHolding(
+            _float = float
+            return [
+                CryptoHolding(
                     asset_code=h.get("asset_code", ""),
-                    total_quantity=float(h.get("total_quantity", 0)),
-                    available_quantity=float(h.get("available_quantity", 0)),
-                    held_for_orders=float(h.get("held_for_orders", 0)),
-                    cost_basis=float(h.get("cost_basis")) if h.get("cost_basis") else None,
-                    market_value=float(h.get("market_value")) if h.get("market_value") else None
-                ))
-
-            return holdings
+                    total_quantity=_float(h.get("total_quantity", 0)),
+                    available_quantity=_float(h.get("available_quantity", 0)),
+                    held_for_orders=_float(h.get("held_for_orders", 0)),
+                    cost_basis=_float(cost_basis) if (cost_basis := h.get("cost_basis")) else None,
+                    market_value=_float(market_value) if (market_value := h.get("market_value")) else None
+                )
+                for h in data.get("results", ())
+            ]
         except Exception as e:
             logger.error("Failed to get crypto holdings", error=str(e))
             return []
@@ -319,57 +474,78 @@ class RobinhoodCryptoClient:
     # ============================================================
 
     async def get_trading_pairs(self) -> List[TradingPair]:
-        """Get all available trading pairs"""
+        """Get all available trading pairs (cached for TRADING_PAIRS_CACHE_TTL seconds)"""
+        if self._pairs_cache and time.monotonic() - self._pairs_cache[0] < self.TRADING_PAIRS_CACHE_TTL:
+            return self._pairs_cache[1]
+
         try:
             data = await self._request("GET", "/api/v1/crypto/trading/trading_pairs/")
 
-            pairs = []
-            for p in data.get("results", []):
-                # API returns: status, quote_code, asset_increment, quote_increment
-                pairs.append(TradingPair(
+            # API returns: status, quote_code, asset_increment, quote_increment
+            _float = float
+            pairs = [
+                TradingPair(
                     symbol=p.get("symbol", ""),
                     asset_code=p.get("asset_code", ""),
                     quote_currency=p.get("quote_code", "USD"),
-                    min_order_size=float(p.get("min_order_size", 0)),
-                    max_order_size=float(p.get("max_order_size", 0)),
-                    min_order_price_increment=float(p.get("quote_increment", 0)),
-                    min_order_quantity_increment=float(p.get("asset_increment", 0)),
+                    min_order_size=_float(p.get("min_order_size", 0)),
+                    max_order_size=_float(p.get("max_order_size", 0)),
+                    min_order_price_increment=_float(p.get("quote_increment", 0)),
+                    min_order_quantity_increment=_float(p.get("asset_increment", 0)),
                     is_tradable=p.get("status") == "tradable"
-                ))
-
+                )
+                for p in data.get("results", ())
+            ]
+            if pairs:
+                self._pairs_cache = (time.monotonic(), pairs)
             return pairs
         except Exception as e:
             logger.error("Failed to get trading pairs", error=str(e))
             return []
 
-    async def get_quote(self, symbol: str) -> Optional[CryptoQuote]:
+    @staticmethod
+    def _parse_quote(
+        q: Dict[str, Any],
+        fallback_symbol: str,
+        timestamp: Optional[datetime] = None
+    ) -> CryptoQuote:
+        """Build a CryptoQuote from a best_bid_ask result"""
+        # API returns: price, bid_inclusive_of_sell_spread, ask_inclusive_of_buy_spread
+        price = float(q.get("price") or 0.0)
+        bid = float(q.get("bid_inclusive_of_sell_spread") or price)
+        ask = float(q.get("ask_inclusive_of_buy_spread") or price)
+        return CryptoQuote(
+            symbol=q.get("symbol", fallback_symbol),
+            bid_price=bid,
+            ask_price=ask,
+            mark_price=price if price > 0 else (bid + ask) * 0.5,
+            high_price=None,
+            low_price=None,
+            open_price=None,
+            volume=None,
+            timestamp=timestamp or datetime.now()
+        )
+
+    async def get_quote(self, symbol: str, timestamp: Optional[datetime] = None) -> Optional[CryptoQuote]:
         """
         Get quote for a single symbol.
 
         Args:
             symbol: Trading pair symbol (e.g., "BTC-USD")
+            timestamp: Quote time to record; defaults to now (get_quotes shares one per batch)
         """
         try:
             # Use best bid/ask endpoint for most accurate pricing
-            data = await self._request("GET", f"/api/v1/crypto/marketdata/best_bid_ask/?symbol={symbol}")
+            data = await self._request(
+                "GET",
+                "/api/v1/crypto/marketdata/best_bid_ask/",
+                signed=not settings.ROBINHOOD_UNSIGNED_MARKET_DATA,
+                params={"symbol": symbol}
+            )
 
-            if data.get("results"):
-                quote_data = data["results"][0]
-                # API returns: price, bid_inclusive_of_sell_spread, ask_inclusive_of_buy_spread
-                price = float(quote_data.get("price", 0))
-                bid = float(quote_data.get("bid_inclusive_of_sell_spread", price))
-                ask = float(quote_data.get("ask_inclusive_of_buy_spread", price))
-                return CryptoQuote(
-                    symbol=quote_data.get("symbol", symbol),
-                    bid_price=bid,
-                    ask_price=ask,
-                    mark_price=price if price > 0 else (bid + ask) / 2,
-                    high_price=None,
-                    low_price=None,
-                    open_price=None,
-                    volume=None,
-                    timestamp=datetime.now()
-                )
+            results = data.get("results")
+            if results:
+                return self._parse_quote(results[0], symbol, timestamp)
             return None
         except Exception as e:
             logger.error("Failed to get quote", symbol=symbol, error=str(e))
@@ -382,27 +558,46 @@ class RobinhoodCryptoClient:
         Args:
             symbols: List of trading pair symbols (e.g., ["BTC-USD", "ETH-USD"])
 
-        Note: API requires separate calls for each symbol, so we batch them.
+        Note: best_bid_ask accepts a repeated symbol parameter, so all symbols go in
+        one signed request. If the server rejects that request (400), for example
+        because one symbol is invalid, quotes are fetched per symbol instead.
         """
-        quotes = []
+        if not symbols:
+            return []
 
-        # Robinhood API doesn't support comma-separated symbols for batch quotes
-        # We need to make individual requests (or use asyncio.gather for parallelism)
-        import asyncio
+        batch_ts = datetime.now()
+        try:
+            data = await self._request(
+                "GET",
+                "/api/v1/crypto/marketdata/best_bid_ask/",
+                signed=not settings.ROBINHOOD_UNSIGNED_MARKET_DATA,
+                params=[("symbol", s) for s in symbols]
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 400:
+                logger.error("Failed to get quotes", count=len(symbols), error=str(e))
+                return []
+            logger.warning("Batch quote request rejected, fetching per symbol", count=len(symbols))
+            return await self._get_quotes_individually(symbols, batch_ts)
+        except Exception as e:
+            logger.error("Failed to get quotes", count=len(symbols), error=str(e))
+            return []
 
-        async def fetch_single(symbol: str) -> Optional[CryptoQuote]:
-            return await self.get_quote(symbol)
+        parse_quote = self._parse_quote
+        return [parse_quote(q, q.get("symbol", ""), batch_ts) for q in data.get("results", ())]
 
-        # Fetch quotes in parallel batches to avoid rate limiting
-        batch_size = 10
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            results = await asyncio.gather(*[fetch_single(s) for s in batch], return_exceptions=True)
-            for result in results:
-                if isinstance(result, CryptoQuote):
-                    quotes.append(result)
+    async def _get_quotes_individually(self, symbols: List[str], batch_ts: datetime) -> List[CryptoQuote]:
+        """Fetch quotes one request per symbol, at most QUOTE_CONCURRENCY in flight"""
+        # A semaphore caps in-flight requests instead of waiting on fixed batches,
+        # so a slow quote never holds up the next group of symbols.
+        semaphore = asyncio.Semaphore(self.QUOTE_CONCURRENCY)
 
-        return quotes
+        async def fetch_single(symbol: str) -> Optional[CryptoQuote]:
+            async with semaphore:
+                return await self.get_quote(symbol, batch_ts)
+
+        results = await asyncio.gather(*(fetch_single(s) for s in symbols), return_exceptions=True)
+        return [result for result in results if isinstance(result, CryptoQuote)]
 
     async def get_estimated_price(
         self,
@@ -440,9 +635,9 @@ class RobinhoodCryptoClient:
         symbol: str,
         side: str,
         order_type: str = "market",
-        quantity: Optional[float] = None,
+        quantity: Optional[Union[Decimal, float]] = None,
         notional_amount: Optional[float] = None,
-        limit_price: Optional[float] = None,
+        limit_price: Optional[Union[Decimal, float]] = None,
         time_in_force: str = "gtc"
     ) -> Optional[CryptoOrder]:
         """
@@ -452,9 +647,9 @@ class RobinhoodCryptoClient:
             symbol: Trading pair symbol (e.g., "BTC-USD")
             side: "buy" or "sell"
             order_type: "market" or "limit"
-            quantity: Amount in asset units (e.g., 0.001 BTC)
+            quantity: Amount in asset units (e.g., 0.001 BTC); Decimal is sent as-is
             notional_amount: Amount in USD (for market orders, alternative to quantity)
-            limit_price: Limit price (required for limit orders)
+            limit_price: Limit price (required for limit orders); Decimal is sent as-is
             time_in_force: "gtc" (good til cancelled) or "ioc" (immediate or cancel)
 
         Returns:
@@ -466,7 +661,7 @@ class RobinhoodCryptoClient:
             - Market orders timeout after 2 minutes
         """
         try:
-            client_order_id = str(uuid.uuid4())
+            client_order_id = _new_client_order_id()
 
             body = {
                 "client_order_id": client_order_id,
@@ -477,19 +672,17 @@ class RobinhoodCryptoClient:
             }
 
             # Helper to format floats without trailing zeros but with precision
-            def format_decimal(value: float) -> str:
-                """Format a float as a decimal string without floating-point artifacts"""
-                # Convert to Decimal to get exact string representation
-                d = Decimal(str(value))
-                # Normalize to remove trailing zeros but keep precision
-                normalized = d.normalize()
-                # Convert to string and ensure it's a proper decimal format
-                s = str(normalized)
-                # If it's in scientific notation, convert back to normal
-                if 'E' in s or 'e' in s:
-                    # Use fixed point notation with enough precision
-                    s = f"{value:.15f}".rstrip('0').rstrip('.')
-                return s
+            def format_decimal(value: Union[Decimal, float]) -> str:
+                """Format a value as a decimal string without floating-point artifacts"""
+                if isinstance(value, Decimal):
+                    # Already rounded to the pair's increment; 'f' avoids scientific notation
+                    return format(value, "f")
+                if value and abs(value) < 1e-10:
+                    # Below fixed-point precision; Decimal keeps the significant digits
+                    return format(Decimal(str(value)).normalize(), "f")
+                # 10 places covers crypto quantity/price increments and rounds away float noise
+                s = f"{value:.10f}".rstrip('0').rstrip('.')
+                return s or "0"
 
             # Use the new Robinhood API format with *_order_config objects
             if order_type == "limit":
@@ -517,6 +710,8 @@ class RobinhoodCryptoClient:
                     raise ValueError("Either quantity or notional_amount must be provided")
 
             data = await self._request("POST", "/api/v1/crypto/trading/orders/", body)
+            # Buying power is now stale
+            self._account_cache = None
 
             logger.info(
                 "Crypto order placed",
@@ -549,8 +744,8 @@ class RobinhoodCryptoClient:
                 status=data.get("state", "pending"),
                 filled_quantity=filled_qty,
                 filled_price=float(data.get("average_price")) if data.get("average_price") else None,
-                created_at=datetime.fromisoformat(data.get("created_at", datetime.now().isoformat()).replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data.get("updated_at").replace("Z", "+00:00")) if data.get("updated_at") else None
+                created_at=_parse_dt(created_at) if (created_at := data.get("created_at")) else datetime.now(),
+                updated_at=_parse_dt(updated_at) if (updated_at := data.get("updated_at")) else None
             )
         except Exception as e:
             logger.error(
@@ -570,41 +765,47 @@ class RobinhoodCryptoClient:
         """
         try:
             await self._request("POST", f"/api/v1/crypto/trading/orders/{order_id}/cancel/")
+            self._account_cache = None
             logger.info("Crypto order cancelled", order_id=order_id)
             return True
         except Exception as e:
             logger.error("Failed to cancel crypto order", order_id=order_id, error=str(e))
             return False
 
+    @staticmethod
+    def _parse_order(o: Dict[str, Any]) -> CryptoOrder:
+        """Build a CryptoOrder from an order payload returned by the API"""
+        # Parse quantity from order config or direct field
+        order_config = o.get("market_order_config") or o.get("limit_order_config")
+        order_quantity = float(order_config.get("asset_quantity", 0)) if order_config else 0.0
+
+        # Parse filled quantity - Robinhood uses "filled_asset_quantity" not "filled_quantity"
+        filled_qty = float(o.get("filled_asset_quantity", o.get("filled_quantity", 0)))
+
+        limit_price = o.get("limit_price")
+        average_price = o.get("average_price")
+        created_at = o.get("created_at")
+        updated_at = o.get("updated_at")
+        return CryptoOrder(
+            id=o.get("id", ""),
+            client_order_id=o.get("client_order_id", ""),
+            symbol=o.get("symbol", ""),
+            side=o.get("side", ""),
+            order_type=o.get("type", ""),
+            quantity=order_quantity,
+            price=float(limit_price) if limit_price else None,
+            status=o.get("state", ""),
+            filled_quantity=filled_qty,
+            filled_price=float(average_price) if average_price else None,
+            created_at=_parse_dt(created_at) if created_at else datetime.now(),
+            updated_at=_parse_dt(updated_at) if updated_at else None
+        )
+
     async def get_order(self, order_id: str) -> Optional[CryptoOrder]:
         """Get order by ID"""
         try:
             data = await self._request("GET", f"/api/v1/crypto/trading/orders/{order_id}/")
-
-            # Parse quantity from order config or direct field
-            order_quantity = 0.0
-            if data.get("market_order_config"):
-                order_quantity = float(data["market_order_config"].get("asset_quantity", 0))
-            elif data.get("limit_order_config"):
-                order_quantity = float(data["limit_order_config"].get("asset_quantity", 0))
-
-            # Parse filled quantity - Robinhood uses "filled_asset_quantity" not "filled_quantity"
-            filled_qty = float(data.get("filled_asset_quantity", data.get("filled_quantity", 0)))
-
-            return CryptoOrder(
-                id=data.get("id", ""),
-                client_order_id=data.get("client_order_id", ""),
-                symbol=data.get("symbol", ""),
-                side=data.get("side", ""),
-                order_type=data.get("type", ""),
-                quantity=order_quantity,
-                price=float(data.get("limit_price")) if data.get("limit_price") else None,
-                status=data.get("state", ""),
-                filled_quantity=filled_qty,
-                filled_price=float(data.get("average_price")) if data.get("average_price") else None,
-                created_at=datetime.fromisoformat(data.get("created_at", datetime.now().isoformat()).replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data.get("updated_at").replace("Z", "+00:00")) if data.get("updated_at") else None
-            )
+            return self._parse_order(data)
         except Exception as e:
             logger.error("Failed to get crypto order", order_id=order_id, error=str(e))
             return None
@@ -622,40 +823,14 @@ class RobinhoodCryptoClient:
             limit: Maximum number of orders to return
         """
         try:
-            path = f"/api/v1/crypto/trading/orders/?limit={limit}"
-            if status:
-                path += f"&state={status}"
-
-            data = await self._request("GET", path)
-
-            orders = []
-            for o in data.get("results", []):
-                # Parse quantity from order config or direct field
-                order_quantity = 0.0
-                if o.get("market_order_config"):
-                    order_quantity = float(o["market_order_config"].get("asset_quantity", 0))
-                elif o.get("limit_order_config"):
-                    order_quantity = float(o["limit_order_config"].get("asset_quantity", 0))
-
-                # Parse filled quantity - Robinhood uses "filled_asset_quantity" not "filled_quantity"
-                filled_qty = float(o.get("filled_asset_quantity", o.get("filled_quantity", 0)))
-
-                orders.append(CryptoOrder(
-                    id=o.get("id", ""),
-                    client_order_id=o.get("client_order_id", ""),
-                    symbol=o.get("symbol", ""),
-                    side=o.get("side", ""),
-                    order_type=o.get("type", ""),
-                    quantity=order_quantity,
-                    price=float(o.get("limit_price")) if o.get("limit_price") else None,
-                    status=o.get("state", ""),
-                    filled_quantity=filled_qty,
-                    filled_price=float(o.get("average_price")) if o.get("average_price") else None,
-                    created_at=datetime.fromisoformat(o.get("created_at", datetime.now().isoformat()).replace("Z", "+00:00")),
-                    updated_at=datetime.fromisoformat(o.get("updated_at").replace("Z", "+00:00")) if o.get("updated_at") else None
-                ))
-
-            return orders
+            data = await self._request(
+                "GET",
+                "/api/v1/crypto/trading/orders/",
+                params={"limit": limit, "state": status or None}
+            )
+
+            parse_order = self._parse_order
+            return [parse_order(o) for o in data.get("results", ())]
         except Exception as e:
             logger.error("Failed to get crypto orders", error=str(e))
             return []
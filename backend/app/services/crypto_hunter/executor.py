@@ -8,13 +8,16 @@ Handles order placement, monitoring, and management.
 import structlog
 import asyncio
 import math
+import time
 from decimal import Decimal, ROUND_DOWN
-from typing import Dict, Any, Optional
+from typing import Awaitable, Coroutine, Dict, Any, List, Optional, Set, Union
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
-from app.services.broker.robinhood_client import RobinhoodCryptoClient, CryptoOrder, TradingPair
+from app.services.broker.robinhood_client import (
+    RobinhoodCryptoClient, CryptoOrder, TradingPair, get_robinhood_client
+)
 
 logger = structlog.get_logger()
 
@@ -29,13 +32,13 @@ class CryptoOrderStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CryptoOrderResult:
     """Result of a crypto order execution"""
     symbol: str
     side: str  # "buy" or "sell"
     order_type: str  # "market" or "limit"
-    requested_quantity: float
+    requested_quantity: Union[Decimal, float]  # Decimal once rounded to the pair's increment
     filled_quantity: float
     filled_price: Optional[float]
     status: CryptoOrderStatus
@@ -44,8 +47,97 @@ class CryptoOrderResult:
     timestamp: datetime
 
 
+@dataclass(frozen=True)
+class PrecisionInfo:
+    """Order increments for a trading pair, with rounding targets computed once"""
+    price_inc: float
+    qty_inc: float
+    price_scale: int  # 10 ** decimal places; 0 when the increment is unknown/non-positive
+    qty_scale: int
+    price_quant: Optional[Decimal]  # Decimal quantize target for the exact rounding path
+    qty_quant: Optional[Decimal]
+
+
+def _decimal_places(increment: float) -> int:
+    return max(0, -int(math.floor(math.log10(increment))))
+
+
+def _quantize_target(increment: float) -> Optional[Decimal]:
+    """Decimal quantize target for an increment (e.g. 0.01 -> Decimal("0.01"))"""
+    if increment <= 0:
+        return None
+    decimal_places = _decimal_places(increment)
+    # Create quantize format string (e.g., "0.01" for precision 0.01)
+    return Decimal(f"0.{'0' * decimal_places}" if decimal_places > 0 else "1")
+
+
+def _precision_info(price_inc: float, qty_inc: float) -> PrecisionInfo:
+    return PrecisionInfo(
+        price_inc=price_inc,
+        qty_inc=qty_inc,
+        price_scale=10 ** _decimal_places(price_inc) if price_inc > 0 else 0,
+        qty_scale=10 ** _decimal_places(qty_inc) if qty_inc > 0 else 0,
+        price_quant=_quantize_target(price_inc),
+        qty_quant=_quantize_target(qty_inc)
+    )
+
+
+# Used for symbols missing from the trading pair cache
+DEFAULT_PRECISION = _precision_info(0.01, 0.00001)
+
+# Relative error bound (with margin) of value * scale against the exact decimal product;
+# scaled values closer than this to an increment boundary take the exact Decimal path
+_SCALE_ERROR = 1e-15
+
+
+def _result(
+    symbol: str,
+    side: str,
+    order_type: str,
+    requested_quantity: Union[Decimal, float],
+    ts: datetime,
+    *,
+    status: CryptoOrderStatus,
+    message: str,
+    filled_quantity: float = 0,
+    filled_price: Optional[float] = None,
+    order_id: Optional[str] = None
+) -> CryptoOrderResult:
+    """Build a CryptoOrderResult; unfilled outcomes only need status and message"""
+    return CryptoOrderResult(
+        symbol=symbol,
+        side=side,
+        order_type=order_type,
+        requested_quantity=requested_quantity,
+        filled_quantity=filled_quantity,
+        filled_price=filled_price,
+        status=status,
+        order_id=order_id,
+        message=message,
+        timestamp=ts
+    )
+
+
+# Broker order states after which an order will not change again
+_TERMINAL_STATUSES = frozenset({"filled", "canceled", "failed", "rejected"})
+
 # Stablecoins that don't support limit orders or shouldn't be traded
-EXCLUDED_SYMBOLS = {"USDC-USD", "USDT-USD", "DAI-USD", "BUSD-USD", "TUSD-USD"}
+EXCLUDED_SYMBOLS = frozenset({"USDC-USD", "USDT-USD", "DAI-USD", "BUSD-USD", "TUSD-USD"})
+
+
+class _RateLimiter:
+    """Spaces acquisitions evenly so at most `rate` start per second"""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
 
 class CryptoExecutor:
@@ -62,80 +154,116 @@ class CryptoExecutor:
 
     # Class-level cache for trading pair info
     _trading_pairs_cache: Dict[str, TradingPair] = {}
+    _precision_cache: Dict[str, PrecisionInfo] = {}
     _cache_loaded: bool = False
+    _cache_lock: Optional[asyncio.Lock] = None  # Created on first load, inside the running loop
+    # Strong refs to fire-and-forget tasks (e.g. timeout cancels) until they finish
+    _background_tasks: Set[asyncio.Task] = set()
 
     def __init__(
         self,
-        robinhood_client: RobinhoodCryptoClient,
+        robinhood_client: Optional[RobinhoodCryptoClient],
         config: Dict[str, Any]
-    ):
+    ) -> None:
         """
         Initialize executor.
 
+        The client should be the shared get_robinhood_client() singleton (the
+        default when None): its pooled HTTP/2 connection is what keeps order
+        placement and the fill-polling loop from paying a TLS handshake per call.
+
         Config options:
         - use_limit_orders: Use limit orders instead of market (default: True)
         - limit_offset_pct: Offset for limit price from current (default: 0.002)
         - order_timeout_seconds: Timeout waiting for fill (default: 120)
         - max_slippage_pct: Maximum allowed slippage (default: 0.01)
         """
-        self.client = robinhood_client
+        self.client: RobinhoodCryptoClient = robinhood_client or get_robinhood_client()
         self.config = config
 
         # Default to market orders for faster execution
         # Limit orders often timeout without filling in crypto markets
-        self.use_limit_orders = config.get("use_limit_orders", False)
-        self.limit_offset_pct = config.get("limit_offset_pct", 0.005)  # 0.5% buffer if limit orders are used
-        self.order_timeout_seconds = config.get("order_timeout_seconds", 60)  # 60 second timeout
-        self.max_slippage_pct = config.get("max_slippage_pct", 0.01)
+        self.use_limit_orders: bool = config.get("use_limit_orders", False)
+        self.limit_offset_pct: float = config.get("limit_offset_pct", 0.005)  # 0.5% buffer if limit orders are used
+        self.order_timeout_seconds: int = config.get("order_timeout_seconds", 60)  # 60 second timeout
+        self.max_slippage_pct: float = config.get("max_slippage_pct", 0.01)
+        # Round order values through Decimal instead of integer scaling (audit/debug use)
+        self.exact_precision_rounding: bool = config.get("exact_precision_rounding", False)
+
+        # Bounds for execute_entries/execute_exits: orders in flight, and order submissions
+        # per second (kept under Robinhood's 10 req/s so fill polling has headroom)
+        self._order_slots = asyncio.Semaphore(config.get("max_concurrent_orders", 5))
+        self._order_rate = _RateLimiter(config.get("order_rate_per_second", 5))
+        # Cap on concurrent order-status requests across all fill waits, so a burst of
+        # open orders polls through a fixed number of HTTP slots
+        self._poll_slots = asyncio.Semaphore(config.get("max_concurrent_polls", 4))
+
+        # Pre-warm the trading pair cache so the first order doesn't pay for the fetch.
+        # Only possible when constructed inside a running loop; otherwise call start().
+        # Skipped without API keys, where the fetch can only come back empty.
+        self._warm_task: Optional[asyncio.Task] = None
+        if not CryptoExecutor._cache_loaded and self.client.is_configured:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                self._warm_task = loop.create_task(self._ensure_trading_pairs_cached())
+
+    async def start(self) -> None:
+        """Load the trading pair cache up front (call at bootstrap when not built inside a loop)"""
+        await self._ensure_trading_pairs_cached()
 
-    async def _ensure_trading_pairs_cached(self):
+    async def _ensure_trading_pairs_cached(self) -> None:
         """Ensure trading pairs are cached for precision lookups"""
-        if not CryptoExecutor._cache_loaded:
+        if CryptoExecutor._cache_loaded:
+            return
+        if CryptoExecutor._cache_lock is None:
+            CryptoExecutor._cache_lock = asyncio.Lock()
+
+        # Single flight: concurrent first callers wait on one fetch instead of each issuing it
+        async with CryptoExecutor._cache_lock:
+            if CryptoExecutor._cache_loaded:
+                return
             pairs = await self.client.get_trading_pairs()
+            if not pairs:
+                # get_trading_pairs returns [] on any failure; leave the cache unloaded so
+                # the next order retries instead of pinning every symbol to DEFAULT_PRECISION
+                logger.warning("Trading pair fetch returned nothing; precision cache not loaded")
+                return
             for pair in pairs:
                 CryptoExecutor._trading_pairs_cache[pair.symbol] = pair
+                CryptoExecutor._precision_cache[pair.symbol] = _precision_info(
+                    pair.min_order_price_increment,
+                    pair.min_order_quantity_increment
+                )
             CryptoExecutor._cache_loaded = True
             logger.debug("Cached trading pair info", count=len(pairs))
 
-    def _get_price_precision(self, symbol: str) -> float:
-        """Get the minimum price increment for a symbol"""
-        pair = CryptoExecutor._trading_pairs_cache.get(symbol)
-        if pair:
-            return pair.min_order_price_increment
-        # Default to 0.01 if not found
-        return 0.01
-
-    def _get_quantity_precision(self, symbol: str) -> float:
-        """Get the minimum quantity increment for a symbol"""
-        pair = CryptoExecutor._trading_pairs_cache.get(symbol)
-        if pair:
-            return pair.min_order_quantity_increment
-        # Default to 0.00001 if not found
-        return 0.00001
-
-    def _round_to_precision(self, value: float, precision: float) -> float:
-        """Round a value to the given precision using Decimal for accuracy"""
-        if precision <= 0:
-            return value
-        # Use Decimal to avoid floating point artifacts
-        d_value = Decimal(str(value))
-        d_precision = Decimal(str(precision))
-        # Calculate decimal places from precision for proper quantization
-        decimal_places = max(0, -int(math.floor(math.log10(precision))))
-        # Create quantize format string (e.g., "0.01" for precision 0.01)
-        quantize_str = f"0.{'0' * decimal_places}" if decimal_places > 0 else "1"
+    def _round_to_precision(self, value: Union[Decimal, float], scale: int, quant: Optional[Decimal]) -> Decimal:
+        """Round a value down to the pair's decimal places, kept as Decimal through to place_order"""
+        if isinstance(value, Decimal):
+            # Decimal callers skip the float conversion entirely
+            return value.quantize(quant, rounding=ROUND_DOWN) if scale else value
+        if not scale:
+            return Decimal(str(value))
         # Round down to avoid exceeding available funds
-        result = d_value.quantize(Decimal(quantize_str), rounding=ROUND_DOWN)
-        return float(result)
-
-    def _is_excluded_symbol(self, symbol: str) -> bool:
-        """Check if symbol is excluded from trading (stablecoins, etc.)"""
-        return symbol in EXCLUDED_SYMBOLS
+        if self.exact_precision_rounding:
+            # str(), not Decimal(value): the float's binary expansion (0.29 -> 0.2899...)
+            # would lose a whole increment under ROUND_DOWN
+            return Decimal(str(value)).quantize(quant, rounding=ROUND_DOWN)
+        scaled = value * scale
+        if abs(scaled - round(scaled)) <= abs(scaled) * _SCALE_ERROR:
+            # Float error could put the floor on either side of this boundary
+            # (0.29 * 100 == 28.999999999999996), so settle it exactly
+            return Decimal(str(value)).quantize(quant, rounding=ROUND_DOWN)
+        # Integer count of increments; dividing by a power of ten is exact in Decimal
+        return Decimal(math.floor(scaled)) / scale
 
     async def execute_entry(
         self,
         symbol: str,
-        quantity: float,
+        quantity: Union[Decimal, float],
         current_price: float,
         limit_price: Optional[float] = None
     ) -> CryptoOrderResult:
@@ -144,13 +272,25 @@ class CryptoExecutor:
 
         Args:
             symbol: Trading pair symbol (e.g., "BTC-USD")
-            quantity: Amount to buy
+            quantity: Amount to buy (Decimal skips the float-to-Decimal conversion)
             current_price: Current market price (for limit calculation)
             limit_price: Optional explicit limit price
 
         Returns:
             CryptoOrderResult with execution details
         """
+        # One timestamp for whichever result this call returns
+        ts = datetime.now(timezone.utc)
+
+        # Check if symbol is excluded (stablecoins, etc.) before any logging or I/O,
+        # so strategies scanning many symbols reject these almost for free
+        if symbol in EXCLUDED_SYMBOLS:
+            return _result(
+                symbol, "buy", "limit", quantity, ts,
+                status=CryptoOrderStatus.REJECTED,
+                message=f"Symbol {symbol} is excluded from trading (stablecoin)"
+            )
+
         logger.info(
             "Executing crypto entry",
             symbol=symbol,
@@ -159,79 +299,50 @@ class CryptoExecutor:
         )
 
         try:
-            # Check if symbol is excluded (stablecoins, etc.)
-            if self._is_excluded_symbol(symbol):
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="buy",
-                    order_type="limit",
-                    requested_quantity=quantity,
-                    filled_quantity=0,
-                    filled_price=None,
-                    status=CryptoOrderStatus.REJECTED,
-                    order_id=None,
-                    message=f"Symbol {symbol} is excluded from trading (stablecoin)",
-                    timestamp=datetime.now()
-                )
+            order_type = "limit" if self.use_limit_orders else "market"
 
-            # Ensure trading pairs are cached for precision lookups
-            await self._ensure_trading_pairs_cached()
-
-            # Check if client is configured
+            # Check if client is configured (before the cache warm-up, which would fail anyway)
             if not self.client.is_configured:
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="buy",
-                    order_type="limit" if self.use_limit_orders else "market",
-                    requested_quantity=quantity,
-                    filled_quantity=0,
-                    filled_price=None,
+                return _result(
+                    symbol, "buy", order_type, quantity, ts,
                     status=CryptoOrderStatus.FAILED,
-                    order_id=None,
-                    message="Robinhood client not configured",
-                    timestamp=datetime.now()
+                    message="Robinhood client not configured"
                 )
 
-            # Get precision for this symbol
-            price_precision = self._get_price_precision(symbol)
-            quantity_precision = self._get_quantity_precision(symbol)
+            # Ensure trading pairs are cached for precision lookups (flag check skips
+            # the coroutine entirely once warmed)
+            if not CryptoExecutor._cache_loaded:
+                await self._ensure_trading_pairs_cached()
+
+            # Get precision for this symbol (one dict hit; defaults if not cached)
+            precision = CryptoExecutor._precision_cache.get(symbol, DEFAULT_PRECISION)
 
             # Round quantity to proper precision
-            rounded_quantity = self._round_to_precision(quantity, quantity_precision)
+            rounded_quantity = self._round_to_precision(quantity, precision.qty_scale, precision.qty_quant)
             if rounded_quantity <= 0:
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="buy",
-                    order_type="limit" if self.use_limit_orders else "market",
-                    requested_quantity=quantity,
-                    filled_quantity=0,
-                    filled_price=None,
+                return _result(
+                    symbol, "buy", order_type, quantity, ts,
                     status=CryptoOrderStatus.REJECTED,
-                    order_id=None,
-                    message=f"Quantity {quantity} rounds to zero with precision {quantity_precision}",
-                    timestamp=datetime.now()
+                    message=f"Quantity {quantity} rounds to zero with precision {precision.qty_inc}"
                 )
 
             # Calculate limit price if using limit orders
+            order_price: Optional[Decimal] = None
             if self.use_limit_orders:
                 if limit_price is None:
                     # Add small buffer above current price for buy orders
                     limit_price = current_price * (1 + self.limit_offset_pct)
                 # Round limit price to proper precision
-                limit_price = self._round_to_precision(limit_price, price_precision)
-                order_type = "limit"
-            else:
-                order_type = "market"
-                limit_price = None
+                order_price = self._round_to_precision(limit_price, precision.price_scale, precision.price_quant)
 
             logger.debug(
                 "Placing order with precision",
                 symbol=symbol,
                 original_quantity=quantity,
                 rounded_quantity=rounded_quantity,
-                limit_price=limit_price,
-                price_precision=price_precision,
-                quantity_precision=quantity_precision
+                limit_price=order_price,
+                price_precision=precision.price_inc,
+                quantity_precision=precision.qty_inc
             )
 
             # Place the order
@@ -240,89 +351,61 @@ class CryptoExecutor:
                 side="buy",
                 order_type=order_type,
                 quantity=rounded_quantity,
-                limit_price=limit_price
+                limit_price=order_price
             )
 
             if not order:
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="buy",
-                    order_type=order_type,
-                    requested_quantity=quantity,
-                    filled_quantity=0,
-                    filled_price=None,
+                return _result(
+                    symbol, "buy", order_type, quantity, ts,
                     status=CryptoOrderStatus.FAILED,
-                    order_id=None,
-                    message="Failed to place order",
-                    timestamp=datetime.now()
+                    message="Failed to place order"
                 )
 
             # Wait for fill (with timeout)
             filled_order = await self._wait_for_fill(order.id)
 
             if filled_order and filled_order.status == "filled":
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="buy",
-                    order_type=order_type,
-                    requested_quantity=quantity,
+                return _result(
+                    symbol, "buy", order_type, quantity, ts,
+                    status=CryptoOrderStatus.FILLED,
                     filled_quantity=filled_order.filled_quantity,
                     filled_price=filled_order.filled_price,
-                    status=CryptoOrderStatus.FILLED,
                     order_id=filled_order.id,
-                    message="Order filled successfully",
-                    timestamp=datetime.now()
+                    message="Order filled successfully"
                 )
             elif filled_order and filled_order.filled_quantity > 0:
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="buy",
-                    order_type=order_type,
-                    requested_quantity=quantity,
+                return _result(
+                    symbol, "buy", order_type, quantity, ts,
+                    status=CryptoOrderStatus.PARTIALLY_FILLED,
                     filled_quantity=filled_order.filled_quantity,
                     filled_price=filled_order.filled_price,
-                    status=CryptoOrderStatus.PARTIALLY_FILLED,
                     order_id=filled_order.id,
-                    message=f"Partial fill: {filled_order.filled_quantity}/{quantity}",
-                    timestamp=datetime.now()
+                    message=f"Partial fill: {filled_order.filled_quantity}/{quantity}"
                 )
             else:
-                # Cancel unfilled order
+                # Cancel unfilled order in the background; the result is CANCELLED either way
                 if order.id:
-                    await self.client.cancel_order(order.id)
+                    self._fire_and_forget(self.client.cancel_order(order.id), name=f"cancel-{order.id}")
 
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="buy",
-                    order_type=order_type,
-                    requested_quantity=quantity,
-                    filled_quantity=0,
-                    filled_price=None,
+                return _result(
+                    symbol, "buy", order_type, quantity, ts,
                     status=CryptoOrderStatus.CANCELLED,
                     order_id=order.id,
-                    message="Order timed out, cancelled",
-                    timestamp=datetime.now()
+                    message="Order timed out, cancelled"
                 )
 
         except Exception as e:
             logger.error("Crypto entry execution failed", symbol=symbol, error=str(e))
-            return CryptoOrderResult(
-                symbol=symbol,
-                side="buy",
-                order_type="unknown",
-                requested_quantity=quantity,
-                filled_quantity=0,
-                filled_price=None,
+            return _result(
+                symbol, "buy", "unknown", quantity, ts,
                 status=CryptoOrderStatus.FAILED,
-                order_id=None,
-                message=f"Execution error: {str(e)}",
-                timestamp=datetime.now()
+                message=f"Execution error: {str(e)}"
             )
 
     async def execute_exit(
         self,
         symbol: str,
-        quantity: float,
+        quantity: Union[Decimal, float],
         current_price: Optional[float] = None,
         reason: str = "manual"
     ) -> CryptoOrderResult:
@@ -331,13 +414,15 @@ class CryptoExecutor:
 
         Args:
             symbol: Trading pair symbol
-            quantity: Amount to sell
+            quantity: Amount to sell (Decimal skips the float-to-Decimal conversion)
             current_price: Current market price (optional)
             reason: Reason for exit (stop_loss, take_profit, manual, etc.)
 
         Returns:
             CryptoOrderResult with execution details
         """
+        # One timestamp for whichever result this call returns
+        ts = datetime.now(timezone.utc)
         logger.info(
             "Executing crypto exit",
             symbol=symbol,
@@ -346,57 +431,43 @@ class CryptoExecutor:
         )
 
         try:
-            # Ensure trading pairs are cached for precision lookups
-            await self._ensure_trading_pairs_cached()
-
             if not self.client.is_configured:
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="sell",
-                    order_type="market",
-                    requested_quantity=quantity,
-                    filled_quantity=0,
-                    filled_price=None,
+                return _result(
+                    symbol, "sell", "market", quantity, ts,
                     status=CryptoOrderStatus.FAILED,
-                    order_id=None,
-                    message="Robinhood client not configured",
-                    timestamp=datetime.now()
+                    message="Robinhood client not configured"
                 )
 
-            # Get precision for this symbol
-            price_precision = self._get_price_precision(symbol)
-            quantity_precision = self._get_quantity_precision(symbol)
+            # Ensure trading pairs are cached for precision lookups (flag check skips
+            # the coroutine entirely once warmed)
+            if not CryptoExecutor._cache_loaded:
+                await self._ensure_trading_pairs_cached()
+
+            # Get precision for this symbol (one dict hit; defaults if not cached)
+            precision = CryptoExecutor._precision_cache.get(symbol, DEFAULT_PRECISION)
 
             # Round quantity to proper precision
-            rounded_quantity = self._round_to_precision(quantity, quantity_precision)
+            rounded_quantity = self._round_to_precision(quantity, precision.qty_scale, precision.qty_quant)
             if rounded_quantity <= 0:
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="sell",
-                    order_type="market",
-                    requested_quantity=quantity,
-                    filled_quantity=0,
-                    filled_price=None,
+                return _result(
+                    symbol, "sell", "market", quantity, ts,
                     status=CryptoOrderStatus.REJECTED,
-                    order_id=None,
-                    message=f"Quantity {quantity} rounds to zero with precision {quantity_precision}",
-                    timestamp=datetime.now()
+                    message=f"Quantity {quantity} rounds to zero with precision {precision.qty_inc}"
                 )
 
             # For exits, prefer market orders for speed
             # Especially for stop losses
+            limit_price: Optional[Decimal] = None
             if reason == "stop_loss":
                 order_type = "market"
-                limit_price = None
             elif self.use_limit_orders and current_price:
                 order_type = "limit"
-                # Small buffer below current price for sell orders
-                limit_price = current_price * (1 - self.limit_offset_pct)
-                # Round limit price to proper precision
-                limit_price = self._round_to_precision(limit_price, price_precision)
+                # Small buffer below current price for sell orders, rounded to proper precision
+                limit_price = self._round_to_precision(
+                    current_price * (1 - self.limit_offset_pct), precision.price_scale, precision.price_quant
+                )
             else:
                 order_type = "market"
-                limit_price = None
 
             logger.debug(
                 "Placing exit order with precision",
@@ -417,34 +488,23 @@ class CryptoExecutor:
             )
 
             if not order:
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="sell",
-                    order_type=order_type,
-                    requested_quantity=quantity,
-                    filled_quantity=0,
-                    filled_price=None,
+                return _result(
+                    symbol, "sell", order_type, quantity, ts,
                     status=CryptoOrderStatus.FAILED,
-                    order_id=None,
-                    message="Failed to place exit order",
-                    timestamp=datetime.now()
+                    message="Failed to place exit order"
                 )
 
             # Wait for fill
             filled_order = await self._wait_for_fill(order.id)
 
             if filled_order and filled_order.status == "filled":
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="sell",
-                    order_type=order_type,
-                    requested_quantity=quantity,
+                return _result(
+                    symbol, "sell", order_type, quantity, ts,
+                    status=CryptoOrderStatus.FILLED,
                     filled_quantity=filled_order.filled_quantity,
                     filled_price=filled_order.filled_price,
-                    status=CryptoOrderStatus.FILLED,
                     order_id=filled_order.id,
-                    message=f"Exit order filled ({reason})",
-                    timestamp=datetime.now()
+                    message=f"Exit order filled ({reason})"
                 )
             else:
                 # For exits, try market order if limit times out
@@ -462,47 +522,86 @@ class CryptoExecutor:
                     if market_order:
                         filled = await self._wait_for_fill(market_order.id)
                         if filled and filled.status == "filled":
-                            return CryptoOrderResult(
-                                symbol=symbol,
-                                side="sell",
-                                order_type="market",
-                                requested_quantity=quantity,
+                            return _result(
+                                symbol, "sell", "market", quantity, ts,
+                                status=CryptoOrderStatus.FILLED,
                                 filled_quantity=filled.filled_quantity,
                                 filled_price=filled.filled_price,
-                                status=CryptoOrderStatus.FILLED,
                                 order_id=filled.id,
-                                message=f"Exit filled at market ({reason})",
-                                timestamp=datetime.now()
+                                message=f"Exit filled at market ({reason})"
                             )
 
-                return CryptoOrderResult(
-                    symbol=symbol,
-                    side="sell",
-                    order_type=order_type,
-                    requested_quantity=quantity,
+                partially_filled = filled_order is not None and filled_order.filled_quantity > 0
+                return _result(
+                    symbol, "sell", order_type, quantity, ts,
+                    status=CryptoOrderStatus.PARTIALLY_FILLED if partially_filled else CryptoOrderStatus.FAILED,
                     filled_quantity=filled_order.filled_quantity if filled_order else 0,
                     filled_price=filled_order.filled_price if filled_order else None,
-                    status=CryptoOrderStatus.PARTIALLY_FILLED if filled_order and filled_order.filled_quantity > 0 else CryptoOrderStatus.FAILED,
                     order_id=order.id,
-                    message="Exit order not fully filled",
-                    timestamp=datetime.now()
+                    message="Exit order not fully filled"
                 )
 
         except Exception as e:
             logger.error("Crypto exit execution failed", symbol=symbol, error=str(e))
-            return CryptoOrderResult(
-                symbol=symbol,
-                side="sell",
-                order_type="unknown",
-                requested_quantity=quantity,
-                filled_quantity=0,
-                filled_price=None,
+            return _result(
+                symbol, "sell", "unknown", quantity, ts,
                 status=CryptoOrderStatus.FAILED,
-                order_id=None,
-                message=f"Exit error: {str(e)}",
-                timestamp=datetime.now()
+                message=f"Exit error: {str(e)}"
             )
 
+    async def execute_entries(self, entries: List[Dict[str, Any]]) -> List[CryptoOrderResult]:
+        """
+        Execute several entries concurrently.
+
+        Each item holds execute_entry keyword arguments (symbol, quantity,
+        current_price, optional limit_price). Orders run under the executor's
+        concurrency and rate limits, so callers should not throttle on top.
+        Results are returned in input order.
+        """
+        return await asyncio.gather(*(
+            self._run_limited(self.execute_entry(**entry)) for entry in entries
+        ))
+
+    async def execute_exits(self, exits: List[Dict[str, Any]]) -> List[CryptoOrderResult]:
+        """
+        Execute several exits concurrently.
+
+        Each item holds execute_exit keyword arguments (symbol, quantity,
+        optional current_price and reason). Same limits and ordering as
+        execute_entries.
+        """
+        return await asyncio.gather(*(
+            self._run_limited(self.execute_exit(**exit_args)) for exit_args in exits
+        ))
+
+    @classmethod
+    def _fire_and_forget(cls, coro: Coroutine[Any, Any, Any], name: str) -> None:
+        """Run a coroutine as a tracked background task, logging rather than raising its failure"""
+        task = asyncio.create_task(coro, name=name)
+        cls._background_tasks.add(task)
+        task.add_done_callback(cls._on_background_done)
+
+    @classmethod
+    def _on_background_done(cls, task: asyncio.Task) -> None:
+        cls._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("Background order task failed", task=task.get_name(), error=str(error))
+
+    @classmethod
+    async def drain_background_tasks(cls) -> None:
+        """Wait for outstanding background order tasks (call on shutdown, before closing the client)"""
+        if cls._background_tasks:
+            await asyncio.gather(*cls._background_tasks, return_exceptions=True)
+
+    async def _run_limited(self, execution: Awaitable[CryptoOrderResult]) -> CryptoOrderResult:
+        """Run one execute_* coroutine inside the order concurrency and rate limits"""
+        async with self._order_slots:
+            await self._order_rate.acquire()
+            return await execution
+
     async def _wait_for_fill(
         self,
         order_id: str,
@@ -518,17 +617,49 @@ class CryptoExecutor:
         Returns:
             Updated CryptoOrder or None if timeout
         """
+        fills = await self._wait_for_fills([order_id], timeout_seconds)
+        return fills[order_id]
+
+    async def _wait_for_fills(
+        self,
+        order_ids: List[str],
+        timeout_seconds: Optional[int] = None
+    ) -> Dict[str, Optional[CryptoOrder]]:
+        """
+        Wait for several orders to fill, polling all pending orders together.
+
+        Each round fetches every still-open order concurrently over the shared
+        connection, so N open orders cost one poll interval instead of N.
+
+        Args:
+            order_ids: Order IDs to monitor
+            timeout_seconds: Timeout in seconds (default from config)
+
+        Returns:
+            Final CryptoOrder per order ID (None if it could not be fetched)
+        """
         timeout = timeout_seconds or self.order_timeout_seconds
-        interval = 2  # Check every 2 seconds
-        elapsed = 0
+        deadline = time.monotonic() + timeout
+        # Poll quickly at first so fast (market) fills are seen fast, backing off to 2 s
+        interval = 0.1
 
-        while elapsed < timeout:
-            try:
-                order = await self.client.get_order(order_id)
+        results: Dict[str, Optional[CryptoOrder]] = dict.fromkeys(order_ids)
+        pending = list(results)
+
+        while pending:
+            orders = await asyncio.gather(
+                *(self._poll_order(order_id) for order_id in pending),
+                return_exceptions=True
+            )
 
-                if order:
-                    if order.status in ["filled", "canceled", "failed", "rejected"]:
-                        return order
+            still_pending = []
+            for order_id, order in zip(pending, orders):
+                if isinstance(order, BaseException):
+                    logger.warning("Error checking order status", order_id=order_id, error=str(order))
+                elif order:
+                    if order.status in _TERMINAL_STATUSES:
+                        results[order_id] = order
+                        continue
 
                     if order.filled_quantity > 0:
                         # Partial fill - continue waiting
@@ -538,20 +669,30 @@ class CryptoExecutor:
                             filled=order.filled_quantity,
                             total=order.quantity
                         )
+                still_pending.append(order_id)
+            pending = still_pending
+
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 1.5, 2.0)
+
+        # Timeout - get final status of whatever is still open
+        if pending:
+            orders = await asyncio.gather(
+                *(self._poll_order(order_id) for order_id in pending),
+                return_exceptions=True
+            )
+            for order_id, order in zip(pending, orders):
+                results[order_id] = None if isinstance(order, BaseException) else order
 
-                await asyncio.sleep(interval)
-                elapsed += interval
-
-            except Exception as e:
-                logger.warning("Error checking order status", order_id=order_id, error=str(e))
-                await asyncio.sleep(interval)
-                elapsed += interval
+        return results
 
-        # Timeout - get final status
-        try:
+    async def _poll_order(self, order_id: str) -> Optional[CryptoOrder]:
+        """Fetch an order's status within the executor-wide poll concurrency cap"""
+        async with self._poll_slots:
             return await self.client.get_order(order_id)
-        except:
-            return None
 
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an open order"""
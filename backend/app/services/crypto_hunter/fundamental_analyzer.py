@@ -5,15 +5,93 @@ Analyzes crypto fundamentals and market metrics.
 Compares assets based on market cap, volume, and correlations.
 """
 
+import os
 import structlog
-from typing import Dict, Any, Optional, List
+import numpy as np
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+
+# Optional: numba JIT for the single-pair correlation kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Under NUMBA_DISABLE_JIT (numba's own switch, e.g. for tests) the kernel runs as plain
+# Python with identical numerics and no compile latency, whether or not numba is installed
+JIT_DISABLED = os.environ.get("NUMBA_DISABLE_JIT", "0") not in ("", "0")
+if JIT_DISABLED:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+USE_PEARSON_KERNEL = NUMBA_AVAILABLE or JIT_DISABLED
 
 logger = structlog.get_logger()
 
 
+def _returns(prices: np.ndarray) -> np.ndarray:
+    """Simple returns, skipping steps from a zero price"""
+    previous = prices[:-1]
+    nonzero = previous != 0
+    return np.diff(prices)[nonzero] / previous[nonzero]
+
+
+def _compute_momentum_score(change_24h: float, change_7d: float) -> float:
+    """Combine short and medium term momentum into a 0-100 percentile"""
+    score = 50.0 + change_24h * 2.0 + change_7d * 0.5
+    return 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
+
+
+if USE_PEARSON_KERNEL:
+    @njit(cache=True)
+    def _pearson(returns1: np.ndarray, returns2: np.ndarray) -> float:
+        """Pearson correlation of two return series over their common length; NaN if undefined"""
+        n = min(len(returns1), len(returns2))
+        if len(returns1) < 5 or len(returns2) < 5:
+            return np.nan
+
+        # Single pass (Welford): running means plus co-moment sums, stable for small returns
+        mean1 = 0.0
+        mean2 = 0.0
+        cov = 0.0
+        var1 = 0.0
+        var2 = 0.0
+        for i in range(n):
+            d1 = returns1[i] - mean1
+            d2 = returns2[i] - mean2
+            mean1 += d1 / (i + 1)
+            mean2 += d2 / (i + 1)
+            e2 = returns2[i] - mean2
+            cov += d1 * e2
+            var1 += d1 * (returns1[i] - mean1)
+            var2 += d2 * e2
+        if var1 == 0 or var2 == 0:
+            return np.nan
+
+        return max(-1.0, min(1.0, cov / np.sqrt(var1 * var2)))
+
+    @njit(cache=True)
+    def _pearson_returns(prices1: np.ndarray, prices2: np.ndarray) -> float:
+        """Pearson correlation of the two series' returns in compiled loops; NaN if undefined"""
+        returns1 = np.empty(len(prices1) - 1)
+        returns2 = np.empty(len(prices2) - 1)
+        n1 = 0
+        for i in range(1, len(prices1)):
+            if prices1[i - 1] != 0:
+                returns1[n1] = (prices1[i] - prices1[i - 1]) / prices1[i - 1]
+                n1 += 1
+        n2 = 0
+        for i in range(1, len(prices2)):
+            if prices2[i - 1] != 0:
+                returns2[n2] = (prices2[i] - prices2[i - 1]) / prices2[i - 1]
+                n2 += 1
+        return _pearson(returns1[:n1], returns2[:n2])
+
+
 class FundamentalRating(str, Enum):
     STRONG = "strong"
     MODERATE = "moderate"
@@ -21,17 +99,53 @@ class FundamentalRating(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+class MetricKind(IntEnum):
+    VOLUME = 0
+    PRICE_POSITION = 1
+    MARKET_CAP_RANK = 2
+    MOMENTUM = 3
+
+
+# Score weight per MetricKind, indexed by its value
+_METRIC_WEIGHTS = (0.25, 0.20, 0.25, 0.30)
+
+# Market cap rank bands (inclusive upper ranks) and their percentiles; past 250 is 20
+_RANK_EDGES = (10, 50, 100, 250)
+_RANK_PERCENTILES = (95, 80, 60, 40, 20)
+
+# Lower bounds of the WEAK/MODERATE/STRONG percentile bands; below the first is UNKNOWN
+_RATING_THRESHOLDS = (0.0, 40.0, 70.0)
+_RATINGS = (
+    FundamentalRating.UNKNOWN,
+    FundamentalRating.WEAK,
+    FundamentalRating.MODERATE,
+    FundamentalRating.STRONG
+)
+
+
+@dataclass(slots=True)
 class FundamentalMetric:
     """Individual fundamental metric"""
-    name: str
+    name: str  # Display name
+    kind: MetricKind
     value: float
     percentile: float  # 0-100, where 100 is best
     rating: FundamentalRating
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ReferenceReturns:
+    """Reference (BTC/ETH) prices with their returns, prepared once per scan"""
+    prices: np.ndarray
+    returns: np.ndarray
+
+    def returns_for(self, n: int) -> np.ndarray:
+        """Returns of the first n prices; the prepared array when n covers the whole series"""
+        return self.returns if n >= len(self.prices) else _returns(self.prices[:n])
+
+
+@dataclass(slots=True)
 class FundamentalAnalysis:
     """Complete fundamental analysis for a crypto asset"""
     symbol: str
@@ -106,9 +220,13 @@ class FundamentalAnalyzer:
         low_52w: Optional[float] = None,
         market_cap_rank: Optional[int] = None,
         price_changes: Optional[Dict[str, float]] = None,
-        btc_prices: Optional[List[float]] = None,
-        eth_prices: Optional[List[float]] = None,
-        asset_prices: Optional[List[float]] = None
+        btc_returns: Optional[ReferenceReturns] = None,
+        eth_returns: Optional[ReferenceReturns] = None,
+        asset_prices: Optional[List[float]] = None,
+        btc_correlation: Optional[float] = None,
+        eth_correlation: Optional[float] = None,
+        now: Optional[datetime] = None,
+        detailed: bool = True
     ) -> FundamentalAnalysis:
         """
         Analyze fundamentals for a crypto asset.
@@ -122,14 +240,21 @@ class FundamentalAnalyzer:
             low_52w: 52-week low price
             market_cap_rank: Market cap ranking
             price_changes: Dict with keys like '1h', '24h', '7d', '30d'
-            btc_prices: BTC price history for correlation
-            eth_prices: ETH price history for correlation
+            btc_returns: BTC returns for correlation (from prepare_reference_returns)
+            eth_returns: ETH returns for correlation (from prepare_reference_returns)
             asset_prices: Asset price history for correlation
+            btc_correlation: Precomputed BTC correlation (e.g. a batch_correlations row);
+                skips the per-symbol calculation from price history
+            eth_correlation: Precomputed ETH correlation, as above
+            now: Analysis timestamp; scanners pass one per batch (default: datetime.now())
+            detailed: Build per-metric details and the summary; False returns only the
+                scores (empty metrics and summary) for pure ranking passes
 
         Returns:
             FundamentalAnalysis with complete fundamental information
         """
         metrics = []
+        scored: List[Tuple[MetricKind, float]] = []  # (kind, percentile) feeding the score
         price_changes = price_changes or {}
 
         # Volume analysis
@@ -140,14 +265,16 @@ class FundamentalAnalyzer:
             # Higher ratio = better (more activity)
             volume_percentile = min(100, volume_ratio * 50)  # 2x avg = 100%
 
-            rating = self._rate_value(volume_percentile)
-            metrics.append(FundamentalMetric(
-                name="Volume Ratio",
-                value=volume_ratio,
-                percentile=volume_percentile,
-                rating=rating,
-                description=f"Volume is {volume_ratio:.1f}x average"
-            ))
+            scored.append((MetricKind.VOLUME, volume_percentile))
+            if detailed:
+                metrics.append(FundamentalMetric(
+                    name="Volume Ratio",
+                    kind=MetricKind.VOLUME,
+                    value=volume_ratio,
+                    percentile=volume_percentile,
+                    rating=self._rate_value(volume_percentile),
+                    description=f"Volume is {volume_ratio:.1f}x average"
+                ))
 
         # Price position in range
         price_percentile = 50.0
@@ -165,96 +292,81 @@ class FundamentalAnalyzer:
 
             # For value plays, lower percentile might be attractive
             # For momentum, higher percentile is preferred
-            rating = self._rate_value(price_percentile)
-            metrics.append(FundamentalMetric(
-                name="Price Position",
-                value=price_percentile,
-                percentile=price_percentile,
-                rating=rating,
-                description=f"At {price_percentile:.0f}% of 52-week range"
-            ))
+            scored.append((MetricKind.PRICE_POSITION, price_percentile))
+            if detailed:
+                metrics.append(FundamentalMetric(
+                    name="Price Position",
+                    kind=MetricKind.PRICE_POSITION,
+                    value=price_percentile,
+                    percentile=price_percentile,
+                    rating=self._rate_value(price_percentile),
+                    description=f"At {price_percentile:.0f}% of 52-week range"
+                ))
 
         # Market cap rank
         rank_percentile = 50.0
         if market_cap_rank:
             # Top 10 = excellent, top 50 = good, top 100 = moderate
-            if market_cap_rank <= 10:
-                rank_percentile = 95
-            elif market_cap_rank <= 50:
-                rank_percentile = 80
-            elif market_cap_rank <= 100:
-                rank_percentile = 60
-            elif market_cap_rank <= 250:
-                rank_percentile = 40
-            else:
-                rank_percentile = 20
-
-            rating = self._rate_value(rank_percentile)
-            metrics.append(FundamentalMetric(
-                name="Market Cap Rank",
-                value=market_cap_rank,
-                percentile=rank_percentile,
-                rating=rating,
-                description=f"Ranked #{market_cap_rank} by market cap"
-            ))
-
-        # Correlations
-        btc_correlation = None
-        eth_correlation = None
-
-        if asset_prices and len(asset_prices) >= 10:
-            if btc_prices and len(btc_prices) >= 10:
-                btc_correlation = self._calculate_correlation(asset_prices, btc_prices)
-            if eth_prices and len(eth_prices) >= 10:
-                eth_correlation = self._calculate_correlation(asset_prices, eth_prices)
+            rank_percentile = _RANK_PERCENTILES[bisect_left(_RANK_EDGES, market_cap_rank)]
+
+            scored.append((MetricKind.MARKET_CAP_RANK, rank_percentile))
+            if detailed:
+                metrics.append(FundamentalMetric(
+                    name="Market Cap Rank",
+                    kind=MetricKind.MARKET_CAP_RANK,
+                    value=market_cap_rank,
+                    percentile=rank_percentile,
+                    rating=self._rate_value(rank_percentile),
+                    description=f"Ranked #{market_cap_rank} by market cap"
+                ))
+
+        # Correlations (NaN from a flat series in batch_correlations counts as unknown)
+        if btc_correlation is not None and np.isnan(btc_correlation):
+            btc_correlation = None
+        if eth_correlation is not None and np.isnan(eth_correlation):
+            eth_correlation = None
+
+        need_btc = btc_correlation is None and btc_returns is not None
+        need_eth = eth_correlation is None and eth_returns is not None
+        if asset_prices and len(asset_prices) >= 10 and (need_btc or need_eth):
+            asset = np.asarray(asset_prices, dtype=np.float64)
+            returns_by_length: Dict[int, np.ndarray] = {}
+            if need_btc:
+                btc_correlation = self._correlate_reference(asset, btc_returns, returns_by_length)
+            if need_eth:
+                eth_correlation = self._correlate_reference(asset, eth_returns, returns_by_length)
 
         # Momentum analysis
-        momentum_score = 50.0
-        momentum_signals = []
-
         change_1h = price_changes.get("1h")
         change_24h = price_changes.get("24h")
         change_7d = price_changes.get("7d")
         change_30d = price_changes.get("30d")
 
-        if change_24h is not None:
-            if change_24h > 5:
-                momentum_signals.append("strong 24h gain")
-            elif change_24h > 0:
-                momentum_signals.append("positive 24h")
-            elif change_24h < -5:
-                momentum_signals.append("strong 24h drop")
-
-        if change_7d is not None:
-            if change_7d > 10:
-                momentum_signals.append("strong weekly gain")
-            elif change_7d < -10:
-                momentum_signals.append("strong weekly drop")
-
         # Calculate momentum percentile
         if change_24h is not None and change_7d is not None:
-            # Combine short and medium term momentum
-            momentum_score = 50 + (change_24h * 2) + (change_7d * 0.5)
-            momentum_score = max(0, min(100, momentum_score))
-
-            rating = self._rate_value(momentum_score)
-            metrics.append(FundamentalMetric(
-                name="Momentum",
-                value=momentum_score,
-                percentile=momentum_score,
-                rating=rating,
-                description=", ".join(momentum_signals) if momentum_signals else "Neutral momentum"
-            ))
+            momentum_score = _compute_momentum_score(change_24h, change_7d)
+
+            scored.append((MetricKind.MOMENTUM, momentum_score))
+            if detailed:
+                momentum_signals = self._momentum_signals(change_24h, change_7d)
+                metrics.append(FundamentalMetric(
+                    name="Momentum",
+                    kind=MetricKind.MOMENTUM,
+                    value=momentum_score,
+                    percentile=momentum_score,
+                    rating=self._rate_value(momentum_score),
+                    description=", ".join(momentum_signals) if momentum_signals else "Neutral momentum"
+                ))
 
         # Calculate overall score
-        score = self._calculate_score(metrics)
+        score = self._calculate_score(scored)
         overall_rating = self._rate_value(score)
 
         # Generate summary
         summary = self._generate_summary(
             symbol, score, overall_rating, metrics,
             volume_ratio, price_percentile, market_cap_rank
-        )
+        ) if detailed else ""
 
         return FundamentalAnalysis(
             symbol=symbol,
@@ -275,9 +387,46 @@ class FundamentalAnalyzer:
             price_change_30d=change_30d,
             metrics=metrics,
             summary=summary,
-            timestamp=datetime.now()
+            timestamp=now or datetime.now()
         )
 
+    def _momentum_signals(self, change_24h: float, change_7d: float) -> List[str]:
+        """Describe notable 24h/7d moves for the momentum metric"""
+        momentum_signals = []
+
+        if change_24h > 5:
+            momentum_signals.append("strong 24h gain")
+        elif change_24h > 0:
+            momentum_signals.append("positive 24h")
+        elif change_24h < -5:
+            momentum_signals.append("strong 24h drop")
+
+        if change_7d > 10:
+            momentum_signals.append("strong weekly gain")
+        elif change_7d < -10:
+            momentum_signals.append("strong weekly drop")
+
+        return momentum_signals
+
+    def prepare_reference_returns(
+        self,
+        btc_prices: Optional[List[float]],
+        eth_prices: Optional[List[float]]
+    ) -> Tuple[Optional[ReferenceReturns], Optional[ReferenceReturns]]:
+        """
+        Convert BTC/ETH price histories to returns once per scan.
+
+        Pass the results to analyze() as btc_returns/eth_returns. A series
+        shorter than 10 prices yields None (too short to correlate).
+        """
+        def to_returns(prices: Optional[List[float]]) -> Optional[ReferenceReturns]:
+            if not prices or len(prices) < 10:
+                return None
+            prices = np.asarray(prices, dtype=np.float64)
+            return ReferenceReturns(prices=prices, returns=_returns(prices))
+
+        return to_returns(btc_prices), to_returns(eth_prices)
+
     def _calculate_correlation(
         self,
         prices1: List[float],
@@ -288,62 +437,127 @@ class FundamentalAnalyzer:
         if n < 5:
             return None
 
+        if USE_PEARSON_KERNEL:
+            correlation = _pearson_returns(
+                np.ascontiguousarray(prices1[:n], dtype=np.float64),
+                np.ascontiguousarray(prices2[:n], dtype=np.float64)
+            )
+            return None if np.isnan(correlation) else float(correlation)
+
         # Use returns instead of prices
-        returns1 = [(prices1[i] - prices1[i-1]) / prices1[i-1]
-                    for i in range(1, n) if prices1[i-1] != 0]
-        returns2 = [(prices2[i] - prices2[i-1]) / prices2[i-1]
-                    for i in range(1, n) if prices2[i-1] != 0]
+        return self._correlate_returns(
+            _returns(np.asarray(prices1[:n], dtype=np.float64)),
+            _returns(np.asarray(prices2[:n], dtype=np.float64))
+        )
+
+    def _correlate_reference(
+        self,
+        asset: np.ndarray,
+        reference: ReferenceReturns,
+        returns_by_length: Dict[int, np.ndarray]
+    ) -> Optional[float]:
+        """Correlate asset and reference returns after truncating both price series to their common length"""
+        n = min(len(asset), len(reference.prices))
+        asset_returns = returns_by_length.get(n)
+        if asset_returns is None:
+            asset_returns = returns_by_length[n] = _returns(asset[:n])
+        return self._correlate_returns(asset_returns, reference.returns_for(n))
+
+    def _correlate_returns(
+        self,
+        returns1: np.ndarray,
+        returns2: np.ndarray
+    ) -> Optional[float]:
+        """Calculate Pearson correlation between two return series over their common length"""
+        if USE_PEARSON_KERNEL:
+            correlation = _pearson(
+                np.ascontiguousarray(returns1, dtype=np.float64),
+                np.ascontiguousarray(returns2, dtype=np.float64)
+            )
+            return None if np.isnan(correlation) else float(correlation)
 
         if len(returns1) < 5 or len(returns2) < 5:
             return None
 
         n = min(len(returns1), len(returns2))
-        returns1 = returns1[:n]
-        returns2 = returns2[:n]
+        returns1 = returns1[:n] - returns1[:n].mean()
+        returns2 = returns2[:n] - returns2[:n].mean()
 
-        mean1 = sum(returns1) / n
-        mean2 = sum(returns2) / n
+        # Pearson r as the dot product of the mean-centered series over their norms
+        norm1 = np.linalg.norm(returns1)
+        norm2 = np.linalg.norm(returns2)
+        if norm1 == 0 or norm2 == 0:
+            return None
 
-        cov = sum((returns1[i] - mean1) * (returns2[i] - mean2) for i in range(n)) / n
-        std1 = (sum((r - mean1) ** 2 for r in returns1) / n) ** 0.5
-        std2 = (sum((r - mean2) ** 2 for r in returns2) / n) ** 0.5
+        correlation = float(returns1 @ returns2) / (norm1 * norm2)
+        return float(np.clip(correlation, -1.0, 1.0))
 
-        if std1 == 0 or std2 == 0:
-            return None
+    @staticmethod
+    def batch_correlations(asset_returns: np.ndarray, ref_returns: np.ndarray) -> np.ndarray:
+        """
+        Correlate many assets against reference series in one matrix product.
 
-        correlation = cov / (std1 * std2)
-        return max(-1, min(1, correlation))
+        Args:
+            asset_returns: (num_assets, T) return series, one row per asset
+            ref_returns: (num_refs, T) reference return series (e.g. BTC and ETH rows)
+
+        Returns:
+            (num_assets, num_refs) Pearson correlations; NaN where a series is flat
+        """
+        assets = np.asarray(asset_returns, dtype=np.float64)
+        refs = np.atleast_2d(np.asarray(ref_returns, dtype=np.float64))
+
+        # Mean-center and L2-normalize each row so the product is Pearson r
+        assets = assets - assets.mean(axis=1, keepdims=True)
+        refs = refs - refs.mean(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            assets /= np.linalg.norm(assets, axis=1, keepdims=True)
+            refs /= np.linalg.norm(refs, axis=1, keepdims=True)
+
+        return np.clip(assets @ refs.T, -1.0, 1.0)
+
+    @staticmethod
+    def score_universe(metric_percentiles: np.ndarray) -> np.ndarray:
+        """
+        Score many assets at once, matching _calculate_score row by row.
+
+        Args:
+            metric_percentiles: (num_assets, len(MetricKind)) percentiles, columns
+                in MetricKind order, NaN where an asset lacks that metric
+
+        Returns:
+            (num_assets,) fundamental scores; 50 for assets with no metrics
+        """
+        percentiles = np.asarray(metric_percentiles, dtype=np.float64)
+        weights = np.asarray(_METRIC_WEIGHTS)
+
+        present = ~np.isnan(percentiles)
+        weighted_sum = np.where(present, percentiles, 0.0) @ weights
+        total_weight = present @ weights
+
+        scores = np.full(len(percentiles), 50.0)
+        np.divide(weighted_sum, total_weight, out=scores, where=total_weight > 0)
+        return scores
 
     def _rate_value(self, percentile: float) -> FundamentalRating:
         """Rate a percentile value"""
-        if percentile >= 70:
-            return FundamentalRating.STRONG
-        elif percentile >= 40:
-            return FundamentalRating.MODERATE
-        elif percentile >= 0:
-            return FundamentalRating.WEAK
-        else:
+        if percentile != percentile:
+            # NaN would otherwise bisect past every threshold
             return FundamentalRating.UNKNOWN
+        return _RATINGS[bisect_right(_RATING_THRESHOLDS, percentile)]
 
-    def _calculate_score(self, metrics: List[FundamentalMetric]) -> float:
-        """Calculate overall fundamental score"""
-        if not metrics:
+    def _calculate_score(self, scored: List[Tuple[MetricKind, float]]) -> float:
+        """Calculate overall fundamental score from (kind, percentile) pairs"""
+        if not scored:
             return 50.0
 
-        # Weight different metrics
-        weights = {
-            "Volume Ratio": 0.25,
-            "Price Position": 0.20,
-            "Market Cap Rank": 0.25,
-            "Momentum": 0.30
-        }
-
         total_weight = 0
         weighted_sum = 0
 
-        for metric in metrics:
-            weight = weights.get(metric.name, 0.25)
-            weighted_sum += metric.percentile * weight
+        # Weight different metrics
+        for kind, percentile in scored:
+            weight = _METRIC_WEIGHTS[kind]
+            weighted_sum += percentile * weight
             total_weight += weight
 
         if total_weight == 0:
@@ -401,4 +615,7 @@ class FundamentalAnalyzer:
 
         Returns list sorted by fundamental score (highest first).
         """
-        return sorted(analyses, key=lambda a: a.score, reverse=True)
+        scores = np.fromiter((a.score for a in analyses), dtype=np.float64, count=len(analyses))
+        # Stable on the negated scores, so ties keep input order as sorted(reverse=True) did
+        order = np.argsort(-scores, kind="stable")
+        return [analyses[i] for i in order]
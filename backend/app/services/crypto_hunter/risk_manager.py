@@ -6,14 +6,18 @@ Uses Kelly Criterion adapted for crypto volatility.
 """
 
 import structlog
-from typing import Dict, Any, Optional, List
+import numpy as np
+from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime, date
 
 logger = structlog.get_logger()
 
+# should_exit_batch reason codes, indexed by the returned int8 value (0 = hold)
+EXIT_REASONS = (None, "stop_loss", "take_profit", "max_hold_time", "trailing_stop")
 
-@dataclass
+
+@dataclass(slots=True)
 class CryptoPositionSize:
     """Calculated position size for crypto trade"""
     symbol: str
@@ -21,10 +25,27 @@ class CryptoPositionSize:
     dollar_amount: float
     position_pct: float  # % of allocated capital
     kelly_fraction: float
-    reasoning: str
+    # Fixed explanation when no position is sized; otherwise the inputs below
+    # are kept and the reasoning text is only formatted when read
+    reason: Optional[str] = None
+    kelly_amount: float = 0.0
+    max_position_pct: float = 0.0
+    max_amount: float = 0.0
+    available: float = 0.0
+
+    @property
+    def reasoning(self) -> str:
+        """Human-readable sizing explanation"""
+        if self.reason is not None:
+            return self.reason
+        return (
+            f"Kelly: {self.kelly_fraction:.1%} → ${self.kelly_amount:.0f}, "
+            f"Max: {self.max_position_pct:.0%} → ${self.max_amount:.0f}, "
+            f"Available: ${self.available:.0f} → Final: ${self.dollar_amount:.0f} ({self.quantity:.6f} units)"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptoRiskStatus:
     """Current risk status for the crypto agent"""
     allocated_capital: float
@@ -75,9 +96,23 @@ class CryptoRiskManager:
         self.max_hold_hours = config.get("max_hold_hours", 168)  # 7 days
 
         # Track performance for Kelly calculations
-        self._trade_history: List[Dict] = []
+        self._n_trades = 0
         self._daily_pnl: Dict[date, float] = {}
 
+        # Running aggregates over the recorded trades, updated in record_trade so the
+        # stats queries never rescan the history
+        self._n_wins = 0
+        self._n_losses = 0
+        self._sum_win_pct = 0.0
+        self._sum_loss_pct = 0.0
+        self._sum_win_pnl = 0.0
+        self._sum_loss_pnl = 0.0
+        self._total_pnl = 0.0
+
+        # History-derived Kelly fraction, valid while the trade count is unchanged
+        self._kelly_cache: Optional[float] = None
+        self._kelly_cache_trades: int = -1
+
     def kelly_fraction(
         self,
         win_rate: float = None,
@@ -89,8 +124,12 @@ class CryptoRiskManager:
 
         Uses more conservative parameters due to crypto volatility.
         """
+        from_history = win_rate is None or avg_win is None or avg_loss is None
+        if from_history and self._kelly_cache_trades == self._n_trades:
+            return self._kelly_cache
+
         # Use historical data if not provided
-        if win_rate is None or avg_win is None or avg_loss is None:
+        if from_history:
             stats = self._calculate_historical_stats()
             win_rate = stats.get("win_rate", 0.45)  # More conservative default
             avg_win = stats.get("avg_win", self.take_profit_pct)
@@ -123,11 +162,16 @@ class CryptoRiskManager:
             adjusted_kelly=kelly
         )
 
+        if from_history:
+            self._kelly_cache = kelly
+            self._kelly_cache_trades = self._n_trades
+
         return kelly
 
     def _calculate_historical_stats(self) -> Dict[str, float]:
         """Calculate win rate and average win/loss from trade history"""
-        if not self._trade_history:
+        total_trades = self._n_wins + self._n_losses
+        if not total_trades:
             # Conservative defaults for crypto
             return {
                 "win_rate": 0.45,
@@ -136,26 +180,23 @@ class CryptoRiskManager:
                 "total_trades": 0
             }
 
-        wins = [t for t in self._trade_history if t.get("pnl", 0) > 0]
-        losses = [t for t in self._trade_history if t.get("pnl", 0) <= 0]
-
-        win_rate = len(wins) / len(self._trade_history) if self._trade_history else 0.45
+        win_rate = self._n_wins / total_trades
 
         avg_win = (
-            sum(t["pnl_pct"] for t in wins) / len(wins)
-            if wins else self.take_profit_pct
+            self._sum_win_pct / self._n_wins
+            if self._n_wins else self.take_profit_pct
         )
 
         avg_loss = (
-            abs(sum(t["pnl_pct"] for t in losses) / len(losses))
-            if losses else self.stop_loss_pct
+            abs(self._sum_loss_pct / self._n_losses)
+            if self._n_losses else self.stop_loss_pct
         )
 
         return {
             "win_rate": win_rate,
             "avg_win": avg_win,
             "avg_loss": avg_loss,
-            "total_trades": len(self._trade_history)
+            "total_trades": total_trades
         }
 
     def record_trade(
@@ -172,14 +213,18 @@ class CryptoRiskManager:
 
         pnl_pct = (exit_price - entry_price) / entry_price if entry_price > 0 else 0
 
-        self._trade_history.append({
-            "symbol": symbol,
-            "entry_price": entry_price,
-            "exit_price": exit_price,
-            "pnl": pnl,
-            "pnl_pct": pnl_pct,
-            "date": trade_date
-        })
+        self._n_trades += 1
+
+        if pnl > 0:
+            self._n_wins += 1
+            self._sum_win_pct += pnl_pct
+            self._sum_win_pnl += pnl
+        else:
+            self._n_losses += 1
+            self._sum_loss_pct += pnl_pct
+            self._sum_loss_pnl += pnl
+        self._total_pnl += pnl
+        self._kelly_cache_trades = -1
 
         # Update daily P&L
         if trade_date not in self._daily_pnl:
@@ -219,7 +264,7 @@ class CryptoRiskManager:
                 dollar_amount=0,
                 position_pct=0,
                 kelly_fraction=0,
-                reasoning="Maximum positions reached"
+                reason="Maximum positions reached"
             )
 
         if available <= 0:
@@ -229,7 +274,7 @@ class CryptoRiskManager:
                 dollar_amount=0,
                 position_pct=0,
                 kelly_fraction=0,
-                reasoning="No available capital"
+                reason="No available capital"
             )
 
         # Calculate Kelly fraction
@@ -261,19 +306,16 @@ class CryptoRiskManager:
         # Calculate actual position percentage
         position_pct = actual_amount / self.allocated_capital if self.allocated_capital > 0 else 0
 
-        reasoning = (
-            f"Kelly: {kelly:.1%} → ${kelly_amount:.0f}, "
-            f"Max: {self.max_position_pct:.0%} → ${max_amount:.0f}, "
-            f"Available: ${available:.0f} → Final: ${actual_amount:.0f} ({quantity:.6f} units)"
-        )
-
         return CryptoPositionSize(
             symbol=symbol,
             quantity=quantity,
             dollar_amount=actual_amount,
             position_pct=position_pct,
             kelly_fraction=kelly,
-            reasoning=reasoning
+            kelly_amount=kelly_amount,
+            max_position_pct=self.max_position_pct,
+            max_amount=max_amount,
+            available=available
         )
 
     def check_daily_limit(self, current_daily_pnl: float) -> bool:
@@ -399,11 +441,46 @@ class CryptoRiskManager:
 
         return False, None
 
+    def should_exit_batch(
+        self,
+        current_prices: np.ndarray,
+        entry_prices: np.ndarray,
+        stop_losses: np.ndarray,
+        take_profits: np.ndarray,
+        hours_held: np.ndarray
+    ) -> np.ndarray:
+        """
+        Evaluate should_exit for a whole portfolio at once.
+
+        All inputs are per-position arrays of equal length.
+
+        Returns:
+            int8 array of reason codes (index into EXIT_REASONS; 0 = hold),
+            with the same priority order as should_exit
+        """
+        current_prices = np.asarray(current_prices, dtype=np.float64)
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl_pct = (current_prices - entry_prices) / entry_prices
+        trailing = (pnl_pct > 0.15) & (current_prices <= entry_prices * 1.01)
+
+        return np.select(
+            [
+                current_prices <= stop_losses,
+                current_prices >= take_profits,
+                np.asarray(hours_held) >= self.max_hold_hours,
+                trailing
+            ],
+            [1, 2, 3, 4],
+            default=0
+        ).astype(np.int8)
+
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get trading performance statistics"""
         stats = self._calculate_historical_stats()
 
-        if not self._trade_history:
+        if not self._n_trades:
             return {
                 "total_trades": 0,
                 "win_rate": 0,
@@ -413,11 +490,8 @@ class CryptoRiskManager:
                 "total_pnl": 0
             }
 
-        wins = [t for t in self._trade_history if t.get("pnl", 0) > 0]
-        losses = [t for t in self._trade_history if t.get("pnl", 0) <= 0]
-
-        total_wins = sum(t["pnl"] for t in wins) if wins else 0
-        total_losses = abs(sum(t["pnl"] for t in losses)) if losses else 1
+        total_wins = self._sum_win_pnl
+        total_losses = abs(self._sum_loss_pnl) if self._n_losses else 1
 
         return {
             "total_trades": stats["total_trades"],
@@ -425,5 +499,5 @@ class CryptoRiskManager:
             "avg_win": stats["avg_win"],
             "avg_loss": stats["avg_loss"],
             "profit_factor": total_wins / total_losses if total_losses > 0 else 0,
-            "total_pnl": sum(t["pnl"] for t in self._trade_history)
+            "total_pnl": self._total_pnl
         }
@@ -20,7 +20,7 @@ from .fundamental_analyzer import FundamentalAnalyzer, FundamentalAnalysis
 from .risk_manager import CryptoRiskManager, CryptoRiskStatus, CryptoPositionSize
 from .executor import CryptoExecutor, CryptoOrderResult, CryptoOrderStatus
 
-from app.services.broker.robinhood_client import RobinhoodCryptoClient
+from app.services.broker.robinhood_client import RobinhoodCryptoClient, CryptoQuote
 from app.services.activity_service import (
     log_cycle_start, log_cycle_end,
     log_trade_signal, log_order, log_position, log_error, log_info
@@ -103,6 +103,8 @@ class CryptoHunterService:
     # Class-level cache for historical prices (persists across instances)
     _class_historical_cache: Dict[str, tuple] = {}
     _class_coingecko_last_request: Optional[datetime] = None
+    # Shared client for CryptoCompare/CoinGecko so historical fetches reuse pooled connections
+    _class_http: Optional[httpx.AsyncClient] = None
 
     def __init__(
         self,
@@ -262,6 +264,24 @@ class CryptoHunterService:
             logger.error("Failed to get trading pairs", error=str(e))
             return []
 
+    @classmethod
+    def _get_http(cls) -> httpx.AsyncClient:
+        """Return the shared historical-data client, creating it on first use"""
+        if cls._class_http is None or cls._class_http.is_closed:
+            cls._class_http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=15.0
+            )
+        return cls._class_http
+
+    @classmethod
+    async def close_http(cls) -> None:
+        """Close the shared historical-data client (call on shutdown)"""
+        if cls._class_http is not None:
+            await cls._class_http.aclose()
+            cls._class_http = None
+
     async def _fetch_historical_prices(self, symbol: str, days: int = 7) -> Optional[List[float]]:
         """
         Fetch historical prices using multiple data sources with fallback.
@@ -320,48 +340,48 @@ class CryptoHunterService:
             # Calculate hours needed (CryptoCompare uses hourly data)
             hours = min(days * 24, 168)  # Max 7 days of hourly data
 
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                url = "https://min-api.cryptocompare.com/data/v2/histohour"
-                params = {
-                    "fsym": coin_code,
-                    "tsym": "USD",
-                    "limit": hours
-                }
+            client = self._get_http()
+            url = "https://min-api.cryptocompare.com/data/v2/histohour"
+            params = {
+                "fsym": coin_code,
+                "tsym": "USD",
+                "limit": hours
+            }
 
-                response = await client.get(url, params=params)
-                response.raise_for_status()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
 
-                data = response.json()
+            data = response.json()
 
-                if data.get("Response") != "Success":
-                    logger.debug(
-                        "CryptoCompare API error",
-                        coin=coin_code,
-                        message=data.get("Message", "Unknown error")
-                    )
-                    return None
+            if data.get("Response") != "Success":
+                logger.debug(
+                    "CryptoCompare API error",
+                    coin=coin_code,
+                    message=data.get("Message", "Unknown error")
+                )
+                return None
 
-                price_data = data.get("Data", {}).get("Data", [])
-                if not price_data:
-                    return None
+            price_data = data.get("Data", {}).get("Data", [])
+            if not price_data:
+                return None
 
-                # Extract close prices
-                prices = [p["close"] for p in price_data if p.get("close", 0) > 0]
+            # Extract close prices
+            prices = [p["close"] for p in price_data if p.get("close", 0) > 0]
 
-                # Resample to ~50 data points for consistent analysis
-                if len(prices) > 50:
-                    step = len(prices) // 50
-                    prices = prices[::step][:50]
+            # Resample to ~50 data points for consistent analysis
+            if len(prices) > 50:
+                step = len(prices) // 50
+                prices = prices[::step][:50]
 
-                if len(prices) >= 20:
-                    logger.debug(
-                        "CryptoCompare fetch successful",
-                        coin=coin_code,
-                        points=len(prices)
-                    )
-                    return prices
+            if len(prices) >= 20:
+                logger.debug(
+                    "CryptoCompare fetch successful",
+                    coin=coin_code,
+                    points=len(prices)
+                )
+                return prices
 
-                return None
+            return None
 
         except Exception as e:
             logger.debug("CryptoCompare fetch failed", coin=coin_code, error=str(e))
@@ -417,45 +437,48 @@ class CryptoHunterService:
             logger.debug("No CoinGecko mapping for coin", coin=coin_code)
             return None
 
-        # Rate limiting for CoinGecko
-        if CryptoHunterService._class_coingecko_last_request:
-            elapsed = (datetime.now() - CryptoHunterService._class_coingecko_last_request).total_seconds()
-            if elapsed < self._coingecko_rate_limit:
-                await asyncio.sleep(self._coingecko_rate_limit - elapsed)
+        # Rate limiting for CoinGecko: reserve the next free slot before sleeping so
+        # concurrent fetches queue up behind each other instead of firing together
+        now = datetime.now()
+        slot = now
+        last_request = CryptoHunterService._class_coingecko_last_request
+        if last_request:
+            slot = max(now, last_request + timedelta(seconds=self._coingecko_rate_limit))
+        CryptoHunterService._class_coingecko_last_request = slot
+        if slot > now:
+            await asyncio.sleep((slot - now).total_seconds())
 
         try:
-            CryptoHunterService._class_coingecko_last_request = datetime.now()
-
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
-                params = {"vs_currency": "usd", "days": days}
+            client = self._get_http()
+            url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
+            params = {"vs_currency": "usd", "days": days}
 
-                response = await client.get(url, params=params)
-                response.raise_for_status()
+            response = await client.get(url, params=params, timeout=10.0)
+            response.raise_for_status()
 
-                data = response.json()
-                prices = data.get("prices", [])
+            data = response.json()
+            prices = data.get("prices", [])
 
-                if not prices:
-                    return None
+            if not prices:
+                return None
 
-                # Extract just the price values
-                price_list = [p[1] for p in prices]
+            # Extract just the price values
+            price_list = [p[1] for p in prices]
 
-                # Resample to ~50 data points
-                if len(price_list) > 50:
-                    step = len(price_list) // 50
-                    price_list = price_list[::step][:50]
+            # Resample to ~50 data points
+            if len(price_list) > 50:
+                step = len(price_list) // 50
+                price_list = price_list[::step][:50]
 
-                if len(price_list) >= 20:
-                    logger.debug(
-                        "CoinGecko fetch successful",
-                        coin=coin_code,
-                        points=len(price_list)
-                    )
-                    return price_list
+            if len(price_list) >= 20:
+                logger.debug(
+                    "CoinGecko fetch successful",
+                    coin=coin_code,
+                    points=len(price_list)
+                )
+                return price_list
 
-                return None
+            return None
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
@@ -469,130 +492,156 @@ class CryptoHunterService:
 
     async def _analyze_pairs(self, pairs: List[str]) -> List[CryptoAnalysis]:
         """Analyze all trading pairs"""
-        analyses = []
-
         # Get quotes for all pairs
         quotes = await self.client.get_quotes(pairs)
         quote_map = {q.symbol: q for q in quotes}
 
-        for symbol in pairs:
-            try:
-                quote = quote_map.get(symbol)
-                if not quote or quote.mark_price <= 0:
-                    continue
+        # One timestamp for every analysis in this scan
+        scan_time = datetime.now()
 
-                current_price = quote.mark_price
+        # Historical fetches are HTTP round-trips; run them concurrently within the API budget
+        fetch_slots = asyncio.Semaphore(self.config.get("max_concurrent_fetches", 16))
 
-                # Get price history - must be real data, no fake/mock data allowed
-                prices = self._price_cache.get(symbol, [])
-                if not prices or len(prices) < 20:
-                    # Fetch historical prices from CoinGecko
-                    historical = await self._fetch_historical_prices(symbol, days=7)
-                    if historical and len(historical) >= 20:
-                        # Use real historical data, append current price
-                        prices = historical[-49:] + [current_price]
-                        self._price_cache[symbol] = prices
-                    else:
-                        # No real historical data available - skip this asset
-                        logger.debug(
-                            "Skipping asset - no historical data available",
-                            symbol=symbol
-                        )
-                        continue
-                else:
-                    # Add current live price to existing price history
-                    prices = prices[-49:] + [current_price]
-                    self._price_cache[symbol] = prices
+        async def analyze_limited(symbol: str) -> Optional[CryptoAnalysis]:
+            async with fetch_slots:
+                return await self._analyze_one(symbol, quote_map.get(symbol), scan_time)
 
-                # Trend analysis
-                trend = self.trend_analyzer.analyze(
-                    symbol=symbol,
-                    prices=prices,
-                    current_price=current_price
-                )
+        results = await asyncio.gather(
+            *(analyze_limited(symbol) for symbol in pairs),
+            return_exceptions=True
+        )
 
-                # Fundamental analysis with actual high/low from price history
-                price_high = max(prices) if prices else current_price
-                price_low = min(prices) if prices else current_price
+        analyses = []
+        for symbol, result in zip(pairs, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to analyze pair", symbol=symbol, error=str(result))
+            elif result is not None:
+                analyses.append(result)
 
-                # Calculate price changes from historical data
-                price_changes = {}
-                if len(prices) >= 2:
-                    price_changes["24h"] = ((prices[-1] - prices[-2]) / prices[-2]) * 100 if prices[-2] > 0 else 0
-                if len(prices) >= 7:
-                    price_changes["7d"] = ((prices[-1] - prices[-7]) / prices[-7]) * 100 if prices[-7] > 0 else 0
+        # Sort by composite score
+        analyses.sort(key=lambda x: x.composite_score, reverse=True)
 
-                fundamental = self.fundamental_analyzer.analyze(
-                    symbol=symbol,
-                    current_price=current_price,
-                    volume_24h=None,  # Would get from market data
-                    avg_volume=None,
-                    high_52w=price_high,  # Use actual high from history
-                    low_52w=price_low,    # Use actual low from history
-                    market_cap_rank=None,
-                    price_changes=price_changes,
-                    asset_prices=prices
-                )
+        logger.info(
+            "Crypto analysis complete",
+            total_pairs=len(pairs),
+            analyzed=len(analyses)
+        )
 
-                # Calculate composite score
-                trend_score = trend.score
-                fundamental_score = fundamental.score
-                momentum_score = self._calculate_momentum_score(prices)
+        return analyses
 
-                composite_score = (
-                    trend_score * self.trend_weight +
-                    fundamental_score * self.fundamental_weight +
-                    momentum_score * self.momentum_weight
-                )
+    async def _analyze_one(
+        self,
+        symbol: str,
+        quote: Optional[CryptoQuote],
+        scan_time: datetime
+    ) -> Optional[CryptoAnalysis]:
+        """Analyze a single trading pair, returning None if it is skipped or below the minimum score"""
+        try:
+            if not quote or quote.mark_price <= 0:
+                return None
 
-                # Only include if meets minimum score
-                if composite_score < self.min_score:
-                    continue
+            current_price = quote.mark_price
 
-                # Calculate trade setup
-                stop_loss = self.risk_manager.calculate_stop_loss(current_price)
-                target_price = self.risk_manager.calculate_take_profit(current_price, stop_loss)
-                risk = current_price - stop_loss
-                reward = target_price - current_price
-                risk_reward = reward / risk if risk > 0 else 0
+            # Get price history - must be real data, no fake/mock data allowed
+            prices = self._price_cache.get(symbol, [])
+            if not prices or len(prices) < 20:
+                # Fetch historical prices from CoinGecko
+                historical = await self._fetch_historical_prices(symbol, days=7)
+                if historical and len(historical) >= 20:
+                    # Use real historical data, append current price
+                    prices = historical[-49:] + [current_price]
+                    self._price_cache[symbol] = prices
+                else:
+                    # No real historical data available - skip this asset
+                    logger.debug(
+                        "Skipping asset - no historical data available",
+                        symbol=symbol
+                    )
+                    return None
+            else:
+                # Add current live price to existing price history
+                prices = prices[-49:] + [current_price]
+                self._price_cache[symbol] = prices
 
-                # Determine entry trigger
-                entry_trigger = self._determine_entry_trigger(trend, fundamental)
+            # Trend analysis
+            trend = self.trend_analyzer.analyze(
+                symbol=symbol,
+                prices=prices,
+                current_price=current_price
+            )
 
-                # Generate reasoning
-                reasoning = self._generate_reasoning(trend, fundamental, composite_score)
+            # Fundamental analysis with actual high/low from price history
+            price_high = max(prices) if prices else current_price
+            price_low = min(prices) if prices else current_price
 
-                analyses.append(CryptoAnalysis(
-                    symbol=symbol,
-                    current_price=current_price,
-                    trend_analysis=trend,
-                    fundamental_analysis=fundamental,
-                    trend_score=trend_score,
-                    fundamental_score=fundamental_score,
-                    momentum_score=momentum_score,
-                    composite_score=composite_score,
-                    entry_price=current_price,
-                    target_price=target_price,
-                    stop_loss=stop_loss,
-                    risk_reward_ratio=risk_reward,
-                    entry_trigger=entry_trigger,
-                    reasoning=reasoning
-                ))
+            # Calculate price changes from historical data
+            price_changes = {}
+            if len(prices) >= 2:
+                price_changes["24h"] = ((prices[-1] - prices[-2]) / prices[-2]) * 100 if prices[-2] > 0 else 0
+            if len(prices) >= 7:
+                price_changes["7d"] = ((prices[-1] - prices[-7]) / prices[-7]) * 100 if prices[-7] > 0 else 0
 
-            except Exception as e:
-                logger.warning("Failed to analyze pair", symbol=symbol, error=str(e))
-                continue
+            fundamental = self.fundamental_analyzer.analyze(
+                symbol=symbol,
+                current_price=current_price,
+                volume_24h=None,  # Would get from market data
+                avg_volume=None,
+                high_52w=price_high,  # Use actual high from history
+                low_52w=price_low,    # Use actual low from history
+                market_cap_rank=None,
+                price_changes=price_changes,
+                asset_prices=prices,
+                now=scan_time
+            )
 
-        # Sort by composite score
-        analyses.sort(key=lambda x: x.composite_score, reverse=True)
+            # Calculate composite score
+            trend_score = trend.score
+            fundamental_score = fundamental.score
+            momentum_score = self._calculate_momentum_score(prices)
 
-        logger.info(
-            "Crypto analysis complete",
-            total_pairs=len(pairs),
-            analyzed=len(analyses)
-        )
+            composite_score = (
+                trend_score * self.trend_weight +
+                fundamental_score * self.fundamental_weight +
+                momentum_score * self.momentum_weight
+            )
 
-        return analyses
+            # Only include if meets minimum score
+            if composite_score < self.min_score:
+                return None
+
+            # Calculate trade setup
+            stop_loss = self.risk_manager.calculate_stop_loss(current_price)
+            target_price = self.risk_manager.calculate_take_profit(current_price, stop_loss)
+            risk = current_price - stop_loss
+            reward = target_price - current_price
+            risk_reward = reward / risk if risk > 0 else 0
+
+            # Determine entry trigger
+            entry_trigger = self._determine_entry_trigger(trend, fundamental)
+
+            # Generate reasoning
+            reasoning = self._generate_reasoning(trend, fundamental, composite_score)
+
+            return CryptoAnalysis(
+                symbol=symbol,
+                current_price=current_price,
+                trend_analysis=trend,
+                fundamental_analysis=fundamental,
+                trend_score=trend_score,
+                fundamental_score=fundamental_score,
+                momentum_score=momentum_score,
+                composite_score=composite_score,
+                entry_price=current_price,
+                target_price=target_price,
+                stop_loss=stop_loss,
+                risk_reward_ratio=risk_reward,
+                entry_trigger=entry_trigger,
+                reasoning=reasoning
+            )
+
+        except Exception as e:
+            logger.warning("Failed to analyze pair", symbol=symbol, error=str(e))
+            return None
 
     def _calculate_momentum_score(self, prices: List[float]) -> float:
         """Calculate momentum score from price history"""
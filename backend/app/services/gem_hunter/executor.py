@@ -372,9 +372,10 @@ class TradeExecutor:
         """
         import asyncio
 
-        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
-        while (datetime.now() - start_time).seconds < timeout:
+        while True:
             # Check order status
             status = await self._get_order_status(trade)
 
@@ -399,7 +400,20 @@ class TradeExecutor:
                     timestamp=datetime.now()
                 )
 
-            await asyncio.sleep(0.5)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            # Wake on the next IB order status change rather than a fixed poll quantum;
+            # only objects without a statusEvent fall back to sleeping
+            status_event = getattr(trade, 'statusEvent', None)
+            if status_event is None:
+                await asyncio.sleep(min(0.5, remaining))
+                continue
+            try:
+                await asyncio.wait_for(status_event, remaining)
+            except asyncio.TimeoutError:
+                break
 
         # Timeout - order still pending
         return OrderResult(
@@ -473,10 +473,12 @@ class GemHunterService:
             )
         ).all()
 
+        prices = await self._get_current_prices([p.symbol for p in positions])
+
         for position in positions:
             try:
                 # Get current price from IB
-                current_price = await self._get_current_price(position.symbol)
+                current_price = prices.get(position.symbol)
 
                 if current_price is None:
                     continue
@@ -553,11 +555,18 @@ class GemHunterService:
 
         return closed
 
+    async def _get_current_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """Get current prices for several symbols, batching the IB requests"""
+        if self.ib_client and self.ib_client.is_connected:
+            return await self.ib_client.get_stock_prices(symbols)
+
+        return {symbol: await self._get_current_price(symbol) for symbol in symbols}
+
     async def _get_current_price(self, symbol: str) -> Optional[float]:
         """Get current price for a symbol"""
         try:
             # Try to get from IB
-            if self.ib_client and self.ib_client.is_connected():
+            if self.ib_client and self.ib_client.is_connected:
                 return await self.ib_client.get_stock_price(symbol)
 
             # Fallback to Yahoo Finance
@@ -654,9 +663,11 @@ class GemHunterService:
             )
         ).all()
 
+        prices = await self._get_current_prices([p.symbol for p in positions])
+
         result = []
         for p in positions:
-            current_price = await self._get_current_price(p.symbol)
+            current_price = prices.get(p.symbol)
             unrealized_pnl = None
             if current_price:
                 unrealized_pnl = (current_price - p.entry_price) * p.quantity
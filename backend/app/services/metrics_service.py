@@ -3,7 +3,7 @@ from sqlalchemy import select, func
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
-from app.models.agent import Agent, AgentRun, Trade, AgentStatus
+from app.models.agent import Agent, AgentRun, Trade, TradeArchive, AgentStatus
 from app.models.metrics import AgentMetric, SystemMetric
 from app.services.agent_service import AgentService
 
@@ -69,6 +69,14 @@ class MetricsService:
             open_trades = sum(1 for t in agent_trades if t.status == "open")
             total_pnl = sum(t.pnl or 0 for t in agent_trades if t.pnl)
 
+            # Closed trades moved out by the nightly archival still count toward the totals
+            archived_result = await self.db.execute(
+                select(func.count(), func.coalesce(func.sum(TradeArchive.pnl), 0))
+                .where(TradeArchive.agent_id == agent.id)
+            )
+            archived_trades, archived_pnl = archived_result.one()
+            total_pnl += archived_pnl
+
             agent_summaries.append({
                 "agent_id": agent.id,
                 "agent_name": agent.name,
@@ -77,7 +85,7 @@ class MetricsService:
                 "total_runs": len(runs),
                 "successful_runs": successful,
                 "failed_runs": failed,
-                "total_trades": len(agent_trades),
+                "total_trades": len(agent_trades) + archived_trades,
                 "open_trades": open_trades,
                 "total_pnl": total_pnl
             })
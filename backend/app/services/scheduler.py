@@ -10,9 +10,10 @@ from datetime import datetime
 from typing import Dict, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
 
-from app.core.database import SyncSessionLocal
+from app.core.database import SyncSessionLocal, AsyncSessionLocal
 from app.models.agent import Agent, AgentStatus
 
 logger = structlog.get_logger()
@@ -42,6 +43,7 @@ def start_scheduler():
     scheduler = get_scheduler()
     if not scheduler.running:
         scheduler.start()
+        schedule_trade_archival()
         logger.info("Background scheduler started")
 
 
@@ -60,7 +62,7 @@ async def run_crypto_hunter_cycle():
     Called by the scheduler based on scan_interval_minutes.
     """
     from app.services.crypto_hunter.service import CryptoHunterService
-    from app.services.broker.robinhood_client import RobinhoodCryptoClient
+    from app.services.broker.robinhood_client import get_robinhood_client
 
     logger.info("Scheduler triggered crypto hunter cycle", timestamp=datetime.now().isoformat())
 
@@ -85,7 +87,8 @@ async def run_crypto_hunter_cycle():
             agent_id = agent.id
 
             # Create service with sync session (CryptoHunterService uses .query() which requires sync session)
-            robinhood_client = RobinhoodCryptoClient()
+            # Reuse the shared client so its keep-alive HTTP/2 connection survives across cycles
+            robinhood_client = get_robinhood_client()
             service = CryptoHunterService(
                 agent_id=agent_id,
                 db=session,
@@ -150,6 +153,32 @@ async def run_gem_hunter_cycle():
         logger.error("Gem hunter cycle failed", error=str(e), exc_info=True)
 
 
+async def run_trade_archival():
+    """Move old closed trades out of the hot trades table"""
+    from app.services.agent_service import AgentService
+
+    try:
+        async with AsyncSessionLocal() as db:
+            archived = await AgentService(db).archive_closed_trades()
+        logger.info("Trade archival completed", archived=archived)
+    except Exception as e:
+        logger.error("Trade archival failed", error=str(e), exc_info=True)
+
+
+def schedule_trade_archival(hour: int = 2, minute: int = 0):
+    """Schedule the nightly trade archival job"""
+    scheduler = get_scheduler()
+    job = scheduler.add_job(
+        run_trade_archival,
+        trigger=CronTrigger(hour=hour, minute=minute),
+        id="trade_archival",
+        name="Trade Archival",
+        replace_existing=True
+    )
+    logger.info("Scheduled nightly trade archival", job_id=job.id)
+    return job.id
+
+
 def schedule_crypto_hunter(interval_minutes: int = 15):
     """
     Schedule the crypto hunter to run at regular intervals.